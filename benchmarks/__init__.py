@@ -0,0 +1,8 @@
+import os
+import sys
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FRAMES_FOLDER_PATH = os.path.join(ROOT_PATH, 'frames')
+
+# game modules are imported by their names, as they are imported in src
+sys.path.insert(0, os.path.join(ROOT_PATH, 'src'))
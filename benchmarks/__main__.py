@@ -0,0 +1,169 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+
+from benchmarks.hot_paths import BENCHMARKS
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+CALIBRATION_SIZE = 10000
+
+
+def _run_calibration() -> None:
+    """Do fixed interpreter work similar to the game hot paths."""
+
+    cells = {}
+    total = 0.0
+    for index in range(CALIBRATION_SIZE):
+        value = index * 0.5
+        cells[index % 97, index % 13] = value
+        total += abs(value - total) * 0.8
+    sorted(cells.values())
+
+
+def run_benchmarks(
+    names: list[str],
+    repeat: int,
+) -> tuple[dict[str, float], dict[str, float]]:
+    """Run benchmarks.
+
+    Each run of a benchmark follows a run of fixed calibration work,
+    so the relative time doesn't depend much on the host speed and
+    its load at the moment.
+
+    Args:
+        names: Names of benchmarks to run;
+        repeat: Number of runs of each benchmark, the fastest one counts.
+
+    Returns:
+        Dicts with best run time in seconds and best run time relative
+        to calibration for each benchmark.
+    """
+
+    calibration = timeit.Timer(_run_calibration)
+    calibration_number, _ = calibration.autorange()
+
+    results, relative_results = {}, {}
+    for name in names:
+        timer = timeit.Timer(BENCHMARKS[name]())
+        number, _ = timer.autorange()
+        times, relative_times = [], []
+        for _ in range(repeat):
+            calibration_time = calibration.timeit(calibration_number)
+            run_time = timer.timeit(number) / number
+            times.append(run_time)
+            relative_times.append(
+                run_time / (calibration_time / calibration_number)
+            )
+        results[name] = min(times)
+        relative_results[name] = min(relative_times)
+    return results, relative_results
+
+
+def compare_with_baseline(
+    results: dict[str, float],
+    baseline: dict[str, float],
+    threshold: float,
+    times: dict[str, float],
+) -> list[str]:
+    """Print comparison of results with baseline.
+
+    Args:
+        results: Run times of benchmarks, absolute or relative;
+        baseline: Baseline run times of benchmarks of the same kind;
+        threshold: Allowed slowdown, e.g. 0.2 for 20%;
+        times: Absolute run times to print.
+
+    Returns:
+        Names of regressed benchmarks.
+    """
+
+    regressions = []
+    for name, result in results.items():
+        run_time = times[name]
+        baseline_result = baseline.get(name)
+        if baseline_result is None:
+            print(f'{name:45} {run_time * 1e3:9.3f} ms  (no baseline)')
+            continue
+
+        change = result / baseline_result - 1
+        mark = ''
+        if change > threshold:
+            regressions.append(name)
+            mark = '  REGRESSION'
+        print(f'{name:45} {run_time * 1e3:9.3f} ms  {change:+7.1%}{mark}')
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Benchmark functions running every tic.',
+    )
+    parser.add_argument(
+        'names',
+        nargs='*',
+        default=list(BENCHMARKS),
+        metavar='name',
+        help=f'benchmarks to run, all by default: {", ".join(BENCHMARKS)}',
+    )
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--output', help='path to save results as json')
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.2,
+        help='allowed slowdown compared to baseline',
+    )
+    parser.add_argument(
+        '--save-baseline',
+        action='store_true',
+        help='save results as new baseline',
+    )
+    args = parser.parse_args()
+
+    unknown_names = set(args.names) - set(BENCHMARKS)
+    if unknown_names:
+        parser.error(f'unknown benchmarks: {", ".join(unknown_names)}')
+
+    results, relative_results = run_benchmarks(args.names, args.repeat)
+    report = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+        'relative_results': relative_results,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(report, output_file, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump(report, baseline_file, indent=2)
+        return
+
+    baseline_report = {'relative_results': {}}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as baseline_file:
+            baseline_report = json.load(baseline_file)
+
+    # baselines saved without calibration are compared by absolute time
+    if 'relative_results' in baseline_report:
+        compared_results = relative_results
+        baseline = baseline_report['relative_results']
+    else:
+        compared_results = results
+        baseline = baseline_report['results']
+    regressions = compare_with_baseline(
+        compared_results, baseline, args.threshold, results
+    )
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
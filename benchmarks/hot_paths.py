@@ -0,0 +1,287 @@
+import random
+import typing
+from statistics import median
+
+from benchmarks import FRAMES_FOLDER_PATH
+from curses_tools import draw_frame
+from frame_buffer import FrameBuffer
+from game_utils import get_frames
+from game_utils import make_delay
+from headless import HeadlessCanvas
+from obstacles import Boxes
+from obstacles import find_collisions
+from obstacles import find_hits
+from obstacles import has_collision
+from obstacles import Obstacle
+from obstacles import ObstaclesGrid
+from physics import update_speed
+from projectiles import Projectiles
+
+WINDOW_ROWS = 40
+WINDOW_COLUMNS = 160
+INPUTS_COUNT = 1000
+SEED = 1957
+
+Benchmark = typing.Callable[[], typing.Callable[[], None]]
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str) -> typing.Callable[[Benchmark], Benchmark]:
+    """Register benchmark.
+
+    Registered function prepares inputs and returns a callable
+    which processes all INPUTS_COUNT inputs once.
+
+    Args:
+        name: Benchmark name.
+    """
+
+    def register(function: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = function
+        return function
+
+    return register
+
+
+def _get_random_rectangles(
+    rng: random.Random,
+) -> list[tuple[float, float, int, int]]:
+    """Get rectangles of garbage size placed over the window.
+
+    Args:
+        rng: Random numbers generator.
+
+    Returns:
+        List of rows, columns and sizes of rectangles.
+    """
+
+    frames = get_frames(FRAMES_FOLDER_PATH)['trash']
+    rectangles = []
+    for _ in range(INPUTS_COUNT):
+        rows, columns = rng.choice(frames).size
+        rectangles.append(
+            (
+                rng.uniform(-rows, WINDOW_ROWS),
+                rng.randint(0, WINDOW_COLUMNS - columns),
+                rows,
+                columns,
+            )
+        )
+    return rectangles
+
+
+@benchmark('curses_tools.draw_frame')
+def bench_draw_frame() -> typing.Callable[[], None]:
+    rng = random.Random(SEED)
+    frames = get_frames(FRAMES_FOLDER_PATH)
+    sprites = frames['trash'] + frames['rocket'] + frames['explosion']
+    canvas = FrameBuffer(HeadlessCanvas(WINDOW_ROWS, WINDOW_COLUMNS))
+    inputs = [
+        (
+            rng.uniform(-5, WINDOW_ROWS),
+            rng.uniform(-5, WINDOW_COLUMNS),
+            rng.choice(sprites),
+        )
+        for _ in range(INPUTS_COUNT)
+    ]
+
+    def run() -> None:
+        for row, column, sprite in inputs:
+            draw_frame(canvas, row, column, sprite)
+        canvas.compose()
+
+    return run
+
+
+@benchmark('frame_buffer.present')
+def bench_present() -> typing.Callable[[], None]:
+    rng = random.Random(SEED)
+    sprites = get_frames(FRAMES_FOLDER_PATH)['trash']
+    canvas = FrameBuffer(HeadlessCanvas(WINDOW_ROWS, WINDOW_COLUMNS))
+    canvas.border()
+    # every tic garbage moves by one row
+    garbage = [
+        (
+            rng.randint(0, WINDOW_ROWS),
+            rng.randint(0, WINDOW_COLUMNS),
+            rng.choice(sprites),
+        )
+        for _ in range(30)
+    ]
+    tics = [
+        [(row + tic, column, sprite) for row, column, sprite in garbage]
+        for tic in range(INPUTS_COUNT // 100)
+    ]
+
+    def run() -> None:
+        for tic in tics:
+            for row, column, sprite in tic:
+                draw_frame(canvas, row, column, sprite)
+            canvas.present()
+
+    return run
+
+
+@benchmark('obstacles.has_collision')
+def bench_has_collision() -> typing.Callable[[], None]:
+    rng = random.Random(SEED)
+    rectangles = _get_random_rectangles(rng)
+    inputs = [
+        (
+            (row, column),
+            (rows, columns),
+            (rng.uniform(0, WINDOW_ROWS), rng.uniform(0, WINDOW_COLUMNS)),
+        )
+        for row, column, rows, columns in rectangles
+    ]
+
+    def run() -> None:
+        for obstacle_corner, obstacle_size, obj_corner in inputs:
+            has_collision(obstacle_corner, obstacle_size, obj_corner)
+
+    return run
+
+
+@benchmark('obstacles.find_collisions')
+def bench_find_collisions() -> typing.Callable[[], None]:
+    rng = random.Random(SEED)
+    obstacles_boxes = Boxes(*zip(*_get_random_rectangles(rng)[:100]))
+    shots_boxes = Boxes()
+    for _ in range(INPUTS_COUNT):
+        shots_boxes.append(
+            rng.uniform(0, WINDOW_ROWS),
+            rng.uniform(0, WINDOW_COLUMNS),
+        )
+
+    def run() -> None:
+        find_collisions(obstacles_boxes, shots_boxes)
+
+    return run
+
+
+@benchmark('obstacles.find_hits')
+def bench_find_hits() -> typing.Callable[[], None]:
+    rng = random.Random(SEED)
+    obstacles_boxes = Boxes(*zip(*_get_random_rectangles(rng)[:100]))
+    ships = [
+        (
+            rng.uniform(0, WINDOW_ROWS),
+            rng.uniform(0, WINDOW_COLUMNS),
+            rng.randint(1, 10),
+            rng.randint(1, 10),
+        )
+        for _ in range(INPUTS_COUNT // 10)
+    ]
+
+    # one rectangle queries have to agree with the batch query
+    expected_hits: list[list[int]] = [[] for _ in ships]
+    for ship, obstacle in find_collisions(
+        obstacles_boxes, Boxes(*zip(*ships))
+    ):
+        expected_hits[ship].append(obstacle)
+    for ship, hits in zip(ships, expected_hits):
+        assert sorted(find_hits(obstacles_boxes, *ship)) == sorted(hits)
+
+    def run() -> None:
+        for ship in ships:
+            find_hits(obstacles_boxes, *ship)
+
+    return run
+
+
+@benchmark('obstacles.ObstaclesGrid.get_collisions')
+def bench_grid_collisions() -> typing.Callable[[], None]:
+    rng = random.Random(SEED)
+    obstacles = ObstaclesGrid()
+    for rectangle in _get_random_rectangles(rng)[:100]:
+        obstacles.add(Obstacle(*rectangle))
+    shots = [
+        (rng.uniform(0, WINDOW_ROWS), rng.uniform(0, WINDOW_COLUMNS))
+        for _ in range(INPUTS_COUNT)
+    ]
+
+    def run() -> None:
+        for row, column in shots:
+            obstacles.get_collisions(row, column)
+
+    return run
+
+
+@benchmark('projectiles.Projectiles.update')
+def bench_projectiles_update() -> typing.Callable[[], None]:
+    rng = random.Random(SEED)
+    obstacles = ObstaclesGrid()
+    for rectangle in _get_random_rectangles(rng)[:100]:
+        obstacles.add(Obstacle(*rectangle))
+    shots = [
+        (
+            rng.uniform(1, WINDOW_ROWS - 1),
+            rng.uniform(1, WINDOW_COLUMNS - 1),
+            rng.uniform(-3, -0.3),
+        )
+        for _ in range(INPUTS_COUNT // 10)
+    ]
+
+    def run() -> None:
+        for obstacle in obstacles:
+            obstacle.is_hit = False
+        projectiles = Projectiles(obstacles, len(shots))
+        for shot in shots:
+            projectiles.fire(*shot)
+        for _ in range(10):
+            projectiles.update(WINDOW_ROWS, WINDOW_COLUMNS)
+
+    return run
+
+
+@benchmark('physics.update_speed')
+def bench_update_speed() -> typing.Callable[[], None]:
+    rng = random.Random(SEED)
+    inputs = [
+        (
+            rng.uniform(-2, 2),
+            rng.uniform(-2, 2),
+            rng.choice((-1, 0, 1)),
+            rng.choice((-1, 0, 1)),
+        )
+        for _ in range(INPUTS_COUNT)
+    ]
+
+    def run() -> None:
+        for arguments in inputs:
+            update_speed(*arguments)
+
+    return run
+
+
+@benchmark('statistics.median')
+def bench_median_clamping() -> typing.Callable[[], None]:
+    rng = random.Random(SEED)
+    inputs = [
+        (1, rng.uniform(-10, WINDOW_ROWS + 10), WINDOW_ROWS - 10)
+        for _ in range(INPUTS_COUNT)
+    ]
+
+    def run() -> None:
+        for min_row, row, max_row in inputs:
+            median([min_row, row, max_row])
+
+    return run
+
+
+@benchmark('game_utils.make_delay')
+def bench_make_delay() -> typing.Callable[[], None]:
+    rng = random.Random(SEED)
+    delays = [rng.randint(1, 20) for _ in range(INPUTS_COUNT // 10)]
+
+    def run() -> None:
+        for delay in delays:
+            coroutine = make_delay(delay)
+            try:
+                while True:
+                    coroutine.send(None)
+            except StopIteration:
+                pass
+
+    return run
@@ -0,0 +1,246 @@
+import collections
+import curses
+import os
+import select
+import signal
+import sys
+import termios
+import tty
+import types
+
+from curses_tools import DOWN_KEY_CODE
+from curses_tools import LEFT_KEY_CODE
+from curses_tools import RIGHT_KEY_CODE
+from curses_tools import set_bell
+from curses_tools import UP_KEY_CODE
+
+# alternate screen, hidden cursor
+ENTER_SEQUENCE = '\x1b[?1049h\x1b[?25l\x1b[0m\x1b[2J'
+# normal attributes, visible cursor, main screen
+EXIT_SEQUENCE = '\x1b[0m\x1b[?25h\x1b[?1049l'
+CLEAR_SEQUENCE = '\x1b[0m\x1b[2J'
+
+ARROW_KEY_CODES = {
+    'A': UP_KEY_CODE,
+    'B': DOWN_KEY_CODE,
+    'C': RIGHT_KEY_CODE,
+    'D': LEFT_KEY_CODE,
+}
+SGR_CODES = [
+    (curses.A_BOLD, '1'),
+    (curses.A_DIM, '2'),
+    (curses.A_UNDERLINE, '4'),
+    (curses.A_BLINK, '5'),
+    (curses.A_REVERSE, '7'),
+]
+
+
+def get_sgr_sequence(attr: int) -> str:
+    """Get escape sequence switching to curses attributes.
+
+    Args:
+        attr: Curses attributes.
+    """
+
+    codes = ['0'] + [code for flag, code in SGR_CODES if attr & flag]
+    return f'\x1b[{";".join(codes)}m'
+
+
+def parse_keys(text: str) -> list[int]:
+    """Get codes of keys from terminal input.
+
+    Args:
+        text: Terminal input.
+
+    Returns:
+        Key codes, arrows get the same codes as in curses.
+    """
+
+    key_codes = []
+    index = 0
+    while index < len(text):
+        # arrows are sent as ESC [ A or ESC O A
+        prefix, key = text[index : index + 2], text[index + 2 : index + 3]
+        if prefix in ('\x1b[', '\x1bO') and key in ARROW_KEY_CODES:
+            key_codes.append(ARROW_KEY_CODES[key])
+            index += 3
+            continue
+        key_codes.append(ord(text[index]))
+        index += 1
+    return key_codes
+
+
+class AnsiTerminal:
+    """Terminal window written with raw escape sequences.
+
+    Replacement of curses window, which collects text drawn during
+    the tic and sends it with one write on refresh. Cursor is moved
+    only when text doesn't continue where the previous one ended,
+    attributes are switched only when they differ from the previous
+    text ones. Use as a context manager, which sets terminal up and
+    restores it.
+
+    Args:
+        input_fileno: File descriptor of the terminal input;
+        output_fileno: File descriptor of the terminal output.
+    """
+
+    def __init__(
+        self,
+        input_fileno: int | None = None,
+        output_fileno: int | None = None,
+    ) -> None:
+        if input_fileno is None:
+            input_fileno = sys.stdin.fileno()
+        if output_fileno is None:
+            output_fileno = sys.stdout.fileno()
+        self.input_fileno = input_fileno
+        self.output_fileno = output_fileno
+
+        self.rows, self.columns = self._read_size()
+        self.keys: collections.deque[int] = collections.deque()
+
+        self._payload: list[str] = []
+        self._cursor: tuple[int, int] | None = None
+        self._attr: int | None = None
+        self._sgr_sequences: dict[int, str] = {}
+        self._is_resized = False
+        self._terminal_attributes: list | None = None
+        self._sigwinch_handler = None
+
+    def _read_size(self) -> tuple[int, int]:
+        columns, rows = os.get_terminal_size(self.output_fileno)
+        return rows, columns
+
+    def _handle_resize(
+        self,
+        signal_number: int,
+        frame: types.FrameType | None,
+    ) -> None:
+        self._is_resized = True
+
+    def __enter__(self) -> 'AnsiTerminal':
+        self._terminal_attributes = termios.tcgetattr(self.input_fileno)
+        # no echo and line buffering, but Ctrl+C still interrupts
+        tty.setcbreak(self.input_fileno)
+        self._sigwinch_handler = signal.signal(
+            signal.SIGWINCH, self._handle_resize
+        )
+        self._write(ENTER_SEQUENCE)
+        set_bell(self.beep)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        set_bell()
+        self._write(EXIT_SEQUENCE)
+        signal.signal(signal.SIGWINCH, self._sigwinch_handler)
+        termios.tcsetattr(
+            self.input_fileno, termios.TCSADRAIN, self._terminal_attributes
+        )
+
+    def _write(self, text: str) -> None:
+        data = text.encode()
+        while data:
+            written = os.write(self.output_fileno, data)
+            data = data[written:]
+
+    def getmaxyx(self) -> tuple[int, int]:
+        return self.rows, self.columns
+
+    def nodelay(self, flag: bool) -> None:
+        pass  # input is always read without waiting
+
+    def keypad(self, flag: bool) -> None:
+        pass
+
+    def getch(self) -> int:
+        """Get code of pressed key, -1 if there are no keys.
+
+        Terminal resize is reported as curses.KEY_RESIZE.
+        """
+
+        if self._is_resized:
+            self._is_resized = False
+            self.rows, self.columns = self._read_size()
+            return curses.KEY_RESIZE
+
+        if not self.keys:
+            readable, _, _ = select.select([self.input_fileno], [], [], 0)
+            if readable:
+                text = os.read(self.input_fileno, 1024).decode(errors='ignore')
+                self.keys.extend(parse_keys(text))
+        if not self.keys:
+            return -1
+        return self.keys.popleft()
+
+    def addstr(
+        self,
+        row: int,
+        column: int,
+        text: str,
+        attr: int = curses.A_NORMAL,
+    ) -> None:
+        """Add text to the payload of the tic.
+
+        Args:
+            row: Row position of text;
+            column: Column position of the first symbol;
+            text: Symbols to write;
+            attr: Symbols attributes.
+
+        Raises:
+            curses.error: If text is out of the window.
+        """
+
+        end = column + len(text)
+        is_inside = 0 <= row < self.rows and 0 <= column < self.columns
+        # as curses does, don't allow to move cursor out of the last cell
+        if not is_inside or end > self.columns - (row == self.rows - 1):
+            raise curses.error('addstr() returned ERR')
+
+        payload = self._payload
+        cursor = self._cursor
+        if cursor is None or cursor[0] != row or cursor[1] > column:
+            payload.append(f'\x1b[{row + 1};{column + 1}H')
+        elif cursor[1] < column:
+            payload.append(f'\x1b[{column - cursor[1]}C')
+
+        if attr != self._attr:
+            sgr_sequence = self._sgr_sequences.get(attr)
+            if sgr_sequence is None:
+                sgr_sequence = get_sgr_sequence(attr)
+                self._sgr_sequences[attr] = sgr_sequence
+            payload.append(sgr_sequence)
+            self._attr = attr
+
+        payload.append(text)
+        # cursor position after the last column depends on the terminal
+        self._cursor = (row, end) if end < self.columns else None
+
+    def addch(
+        self,
+        row: int,
+        column: int,
+        symbol: str,
+        attr: int = curses.A_NORMAL,
+    ) -> None:
+        self.addstr(row, column, symbol, attr)
+
+    def beep(self) -> None:
+        """Ring the bell with the payload of the tic."""
+
+        self._payload.append('\a')
+
+    def clear(self) -> None:
+        """Blank the window on the next refresh."""
+
+        self._payload = [CLEAR_SEQUENCE]
+        self._attr = curses.A_NORMAL
+
+    def refresh(self) -> None:
+        """Send payload of the tic to the terminal."""
+
+        if not self._payload:
+            return
+        self._write(''.join(self._payload))
+        self._payload = []
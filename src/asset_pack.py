@@ -0,0 +1,165 @@
+import argparse
+import json
+import mmap
+import os
+import struct
+import typing
+from collections.abc import Mapping
+
+import config
+from curses_tools import Sprite
+from game_utils import get_frames
+
+MAGIC = b'SPACEPK2'
+# magic and index length
+HEADER = struct.Struct(f'<{len(MAGIC)}sI')
+
+
+def build_asset_pack(frames_folder_path: str, pack_path: str) -> None:
+    """Compile frames folder into one asset pack file.
+
+    Pack starts with a header and an index — for each animation,
+    offsets and lengths of its frames. Encoded frames texts follow
+    the index. Animation name is the file name prefix before
+    `_`, frames of an animation are ordered by file names.
+
+    Args:
+        frames_folder_path: Path to folder with game frames;
+        pack_path: Path to pack file.
+    """
+
+    index: dict[str, list[tuple[int, int]]] = {}
+    blobs, offset = [], 0
+    for file_name in sorted(os.listdir(frames_folder_path)):
+        file_path = os.path.join(frames_folder_path, file_name)
+        if not os.path.isfile(file_path):
+            continue
+
+        with open(file_path) as frame_file:
+            blob = frame_file.read().encode()
+
+        frame_type, *_ = file_name.split('_')
+        index.setdefault(frame_type, []).append((offset, len(blob)))
+        blobs.append(blob)
+        offset += len(blob)
+
+    encoded_index = json.dumps(index).encode()
+    temp_path = f'{pack_path}.tmp'
+    try:
+        with open(temp_path, 'wb') as pack_file:
+            pack_file.write(HEADER.pack(MAGIC, len(encoded_index)))
+            pack_file.write(encoded_index)
+            pack_file.writelines(blobs)
+        # readers never see a partly written pack
+        os.replace(temp_path, pack_path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def is_asset_pack_stale(frames_folder_path: str, pack_path: str) -> bool:
+    """Check if pack is missing, has old format or is older than frames.
+
+    Args:
+        frames_folder_path: Path to folder with game frames;
+        pack_path: Path to pack file.
+    """
+
+    if not os.path.exists(pack_path):
+        return True
+    with open(pack_path, 'rb') as pack_file:
+        if pack_file.read(len(MAGIC)) != MAGIC:
+            return True
+    if not os.path.isdir(frames_folder_path):
+        return False  # pack is shipped without frames
+
+    pack_mtime = os.path.getmtime(pack_path)
+    with os.scandir(frames_folder_path) as entries:
+        frames_mtimes = [entry.stat().st_mtime for entry in entries]
+    frames_mtimes.append(os.path.getmtime(frames_folder_path))
+    return max(frames_mtimes) > pack_mtime
+
+
+class AssetPack(Mapping):
+    """Memory mapped asset pack with frames decoded on first use.
+
+    Works as a read-only dict of animation frames, so it replaces
+    result of `get_frames`. Opening a pack reads only its index,
+    frames of an animation are decoded when it's requested first.
+
+    Args:
+        pack_path: Path to pack file.
+    """
+
+    def __init__(self, pack_path: str) -> None:
+        with open(pack_path, 'rb') as pack_file:
+            self._data = mmap.mmap(
+                pack_file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+
+        magic, index_length = HEADER.unpack_from(self._data)
+        if magic != MAGIC:
+            raise ValueError(f'{pack_path} is not an asset pack.')
+
+        index_end = HEADER.size + index_length
+        self._index: dict[str, list[list[int]]] = json.loads(
+            self._data[HEADER.size : index_end]
+        )
+        self._blobs_start = index_end
+        self._frames: dict[str, list[Sprite]] = {}
+
+    def __getitem__(self, name: str) -> list[Sprite]:
+        frames = self._frames.get(name)
+        if frames is None:
+            frames = self._frames[name] = [
+                Sprite(self._decode(offset, length))
+                for offset, length in self._index[name]
+            ]
+        return frames
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _decode(self, offset: int, length: int) -> str:
+        start = self._blobs_start + offset
+        return self._data[start : start + length].decode()
+
+    def close(self) -> None:
+        self._data.close()
+
+
+def load_asset_pack(
+    frames_folder_path: str = config.FRAMES_FOLDER_PATH,
+    pack_path: str = config.ASSET_PACK_PATH,
+) -> Mapping[str, list[Sprite]]:
+    """Open asset pack, rebuild it first if frames have changed.
+
+    If the pack can't be written, e.g. the game is installed into
+    a read-only folder, frames are read from the frames folder.
+
+    Args:
+        frames_folder_path: Path to folder with game frames;
+        pack_path: Path to pack file.
+    """
+
+    if is_asset_pack_stale(frames_folder_path, pack_path):
+        try:
+            build_asset_pack(frames_folder_path, pack_path)
+        except OSError:
+            return get_frames(frames_folder_path)
+    return AssetPack(pack_path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Compile frames folder into asset pack.'
+    )
+    parser.add_argument('--frames', default=config.FRAMES_FOLDER_PATH)
+    parser.add_argument('--output', default=config.ASSET_PACK_PATH)
+    args = parser.parse_args()
+
+    build_asset_pack(args.frames, args.output)
@@ -1,3 +1,5 @@
+import os
+
 STAR_SYMBOLS = '+*.:'
 STARS_COUNT = 100
 MAX_BLINK_DELAY = 20
@@ -5,8 +7,23 @@ MIN_BLINK_DELAY = 1
 
 CHANGE_YEAR_DELAY = 10
 
-FRAMES_FOLDER_PATH = '../frames'
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FRAMES_FOLDER_PATH = os.path.join(ROOT_PATH, 'frames')
+# frames compiled by asset_pack.py, rebuilt when frames change
+ASSET_PACK_PATH = os.path.join(ROOT_PATH, 'frames.pack')
 
 FIRE_START_YEAR = 2020
+# size of shots pool, fire is ignored while all shots are in flight
+MAX_SHOTS = 128
+# presses waiting to fire, one shot is fired per tic
+MAX_QUEUED_SHOTS = 3
+# bots fire from their own pool, so they never take shots of the player
+MAX_BOT_SHOTS = 128
 
 TIC_TIMEOUT = 0.1
+# number of late tics to run without sleep, 0 — skip missed tics
+MAX_CATCH_UP_TICS = 0
+
+# rows and columns of shared memory frames in split render mode,
+# bigger terminal shows the game cropped
+MAX_SHARED_FRAME_SIZE = (200, 600)
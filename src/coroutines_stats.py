@@ -0,0 +1,188 @@
+import time
+import typing
+
+from frame_buffer import FrameBuffer
+from game_utils import make_delay
+from input_reader import InputReader
+from load_governor import LoadGovernor
+from projectiles import Projectiles
+from spectators import SpectatorServer
+from tic_clock import TicClock
+
+
+class CoroutineTypeStats:
+    def __init__(self) -> None:
+        self.sends = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.live = 0
+
+    def add_step(self, step_time: float) -> None:
+        self.sends += 1
+        self.total_time += step_time
+        self.max_time = max(self.max_time, step_time)
+
+
+class CoroutinesStats:
+    """CPU time accounting of coroutines grouped by coroutine function.
+
+    Work done outside coroutines, e.g. moving entities, is accounted
+    as named sections of the tic. Tics work of the game clock,
+    latency of keys taken by the input reader, shots dropped by full
+    shots pools and resyncs of slow spectators are reported under
+    the table.
+    """
+
+    def __init__(self) -> None:
+        self.by_name: dict[str, CoroutineTypeStats] = {}
+        self.tic_clock: TicClock | None = None
+        self.input_reader: InputReader | None = None
+        self.projectiles: dict[str, Projectiles] = {}
+        self.spectator_server: SpectatorServer | None = None
+        self._live_coroutines: set[typing.Coroutine] = set()
+
+    def _get_stats(self, name: str) -> CoroutineTypeStats:
+        stats = self.by_name.get(name)
+        if stats is None:
+            stats = self.by_name[name] = CoroutineTypeStats()
+        return stats
+
+    def send(self, coroutine: typing.Coroutine) -> typing.Any:
+        """Send None to coroutine and measure time of the step.
+
+        Args:
+            coroutine: Game coroutine.
+
+        Returns:
+            Value yielded by coroutine.
+
+        Raises:
+            StopIteration: If coroutine has finished.
+        """
+
+        stats = self._get_stats(coroutine.__name__)
+        if coroutine not in self._live_coroutines:
+            self._live_coroutines.add(coroutine)
+            stats.live += 1
+
+        start = time.perf_counter()
+        try:
+            return coroutine.send(None)
+        except StopIteration:
+            self.discard(coroutine)
+            raise
+        finally:
+            stats.add_step(time.perf_counter() - start)
+
+    def call(
+        self,
+        name: str,
+        function: typing.Callable[..., typing.Any],
+        *args: typing.Any,
+    ) -> typing.Any:
+        """Call function and measure its time as a named section.
+
+        Args:
+            name: Section name, e.g. `entities.update`;
+            function: Function to call;
+            args: Function arguments.
+
+        Returns:
+            Value returned by function.
+        """
+
+        stats = self._get_stats(name)
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            stats.add_step(time.perf_counter() - start)
+
+    def discard(self, coroutine: typing.Coroutine) -> None:
+        """Stop counting coroutine as live, e.g. when it's cancelled.
+
+        Args:
+            coroutine: Game coroutine.
+        """
+
+        if coroutine in self._live_coroutines:
+            self._live_coroutines.remove(coroutine)
+            self.by_name[coroutine.__name__].live -= 1
+
+    def get_report_lines(self) -> list[str]:
+        """Get stats as table lines sorted by total time."""
+
+        lines = [
+            f'{"coroutine":<24}{"live":>6}{"sends":>9}'
+            f'{"total ms":>10}{"avg us":>8}{"max us":>8}'
+        ]
+        rows = sorted(
+            self.by_name.items(),
+            key=lambda item: item[1].total_time,
+            reverse=True,
+        )
+        for name, stats in rows:
+            average_time = stats.total_time / stats.sends if stats.sends else 0
+            lines.append(
+                f'{name[:23]:<24}{stats.live:>6}{stats.sends:>9}'
+                f'{stats.total_time * 1e3:>10.1f}'
+                f'{average_time * 1e6:>8.1f}{stats.max_time * 1e6:>8.1f}'
+            )
+
+        clock = self.tic_clock
+        if clock is not None:
+            budget_state = ', over budget' if clock.is_over_budget else ''
+            lines.append(
+                f'tic work: {clock.average_work_time * 1e3:.1f} ms average, '
+                f'{clock.max_work_time * 1e3:.1f} ms max{budget_state}'
+            )
+            lines.append(
+                f'missed deadlines: {clock.missed_deadlines}, '
+                f'skipped tics: {clock.skipped_tics}'
+            )
+
+        input_reader = self.input_reader
+        if input_reader is not None:
+            lines.append(
+                f'keys: {input_reader.events_count}, latency '
+                f'{input_reader.average_latency * 1e3:.1f} ms average, '
+                f'{input_reader.max_latency * 1e3:.1f} ms max'
+            )
+
+        if self.projectiles:
+            dropped_shots = ', '.join(
+                f'{name} {projectiles.dropped_shots}'
+                for name, projectiles in self.projectiles.items()
+            )
+            lines.append(f'dropped shots: {dropped_shots}')
+
+        spectator_server = self.spectator_server
+        if spectator_server is not None:
+            lines.append(
+                f'spectators: {len(spectator_server.spectators)} watching, '
+                f'{spectator_server.spectators_count} connected, '
+                f'{spectator_server.resyncs} resyncs'
+            )
+        return lines
+
+
+async def show_coroutines_stats(
+    canvas: FrameBuffer,
+    coroutines_stats: CoroutinesStats,
+    governor: LoadGovernor | None = None,
+) -> None:
+    """Display coroutines stats in the right upper corner.
+
+    Args:
+        canvas: Frame buffer of main window;
+        coroutines_stats: Stats to display;
+        governor: Governor choosing stats update period.
+    """
+
+    while True:
+        lines = coroutines_stats.get_report_lines()
+        width = len(lines[0])
+        column = canvas.viewport.columns - width - 1
+        for row, line in enumerate(lines, 1):
+            canvas.pin(row, column, line[:width].ljust(width))
+        await make_delay(governor.hud_period if governor else 1)
@@ -1,4 +1,5 @@
 import curses
+import typing
 
 SPACE_KEY_CODE = 32
 LEFT_KEY_CODE = 260
@@ -6,26 +7,24 @@ RIGHT_KEY_CODE = 261
 UP_KEY_CODE = 259
 DOWN_KEY_CODE = 258
 
+# rings the terminal bell, replaced by terminals that bypass curses
+_ring_bell: typing.Callable[[], None] = curses.beep
 
-def read_controls(canvas: curses.window) -> tuple[int, int, bool]:
-    """Read keys pressed.
+
+def parse_controls(key_codes: typing.Iterable[int]) -> tuple[int, int, int]:
+    """Get controls state from codes of pressed keys.
 
     Args:
-        canvas: Main window.
+        key_codes: Codes of keys in the order they were pressed.
 
     Returns:
-        Tuple with controls state.
+        Rows direction, columns direction and number of fire presses.
     """
 
     rows_direction = columns_direction = 0
-    space_pressed = False
-
-    while True:
-        pressed_key_code = canvas.getch()
-
-        if pressed_key_code == -1:
-            break
+    fire_presses = 0
 
+    for pressed_key_code in key_codes:
         if pressed_key_code == UP_KEY_CODE:
             rows_direction = -1
 
@@ -39,15 +38,80 @@ def read_controls(canvas: curses.window) -> tuple[int, int, bool]:
             columns_direction = -1
 
         if pressed_key_code == SPACE_KEY_CODE:
-            space_pressed = True
-    return rows_direction, columns_direction, space_pressed
+            fire_presses += 1
+    return rows_direction, columns_direction, fire_presses
+
+
+class Sprite:
+    """Multiline text fragment compiled for fast rendering.
+
+    Keeps frame size and runs of non-blank symbols, so drawing
+    doesn't need to parse text and skip spaces again.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+        lines = text.splitlines()
+        self.rows = len(lines)
+        self.columns = max([len(line) for line in lines], default=0)
+        self.runs = tuple(_get_runs(lines))
+
+    def __str__(self) -> str:
+        return self.text
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """Pair — number of rows and columns."""
+
+        return self.rows, self.columns
+
+
+def _get_runs(
+    lines: list[str],
+) -> typing.Generator[tuple[int, int, str], None, None]:
+    """Get runs of non-blank symbols.
+
+    Args:
+        lines: Lines of multiline text.
+
+    Yields:
+        Row offset, column offset and symbols of a run.
+    """
+
+    for row_offset, line in enumerate(lines):
+        column_offset = 0
+        for run in line.split(' '):
+            if run:
+                yield row_offset, column_offset, run
+            column_offset += len(run) + 1
+
+
+def set_bell(ring_bell: typing.Callable[[], None] | None = None) -> None:
+    """Set function ringing the terminal bell on beep.
+
+    Args:
+        ring_bell: Function to ring the bell, `curses.beep` if None.
+    """
+
+    global _ring_bell
+    _ring_bell = ring_bell or curses.beep
+
+
+def beep() -> None:
+    """Beep if the game is running in a terminal."""
+
+    try:
+        _ring_bell()
+    except curses.error:
+        pass  # curses isn't initialized, e.g. the game runs headless
 
 
 def draw_frame(
     canvas: curses.window,
     start_row: int | float,
     start_column: int | float,
-    text: str,
+    text: str | Sprite,
     negative: bool = False,
 ) -> None:
     """Draw multiline text fragment on canvas,
@@ -57,57 +121,63 @@ def draw_frame(
         canvas: Main window;
         start_row: Current position row of frame;
         start_column: Current position column of frame;
-        text: Multiline text;
+        text: Multiline text or sprite;
         negative: Flag indicating to draw or erase text.
     """
 
     rows_number, columns_number = canvas.getmaxyx()
+    sprite = text if isinstance(text, Sprite) else Sprite(text)
+    start_row, start_column = round(start_row), round(start_column)
 
-    for row, line in enumerate(text.splitlines(), round(start_row)):
-        if row < 0:
+    for row_offset, column_offset, run in sprite.runs:
+        row = start_row + row_offset
+        if row < 0 or row >= rows_number:
             continue
 
-        if row >= rows_number:
-            break
+        column = start_column + column_offset
+        if column < 0:
+            run = run[-column:]
+            column = 0
 
-        for column, symbol in enumerate(line, round(start_column)):
-            if column < 0:
-                continue
-
-            if column >= columns_number:
-                break
+        # the last cell of the window can't be drawn
+        max_column = columns_number - (row == rows_number - 1)
+        if column >= max_column:
+            continue
 
-            if symbol == ' ':
-                continue
+        if column + len(run) > max_column:
+            run = run[: max_column - column]
 
-            if row == rows_number - 1 and column == columns_number - 1:
-                continue
+        if not run:
+            continue
 
-            symbol = symbol if not negative else ' '
-            canvas.addch(row, column, symbol)
+        run = run if not negative else ' ' * len(run)
+        canvas.addstr(row, column, run)
 
 
-def get_frame_size(frame: str) -> tuple[int, int]:
+def get_frame_size(frame: str | Sprite) -> tuple[int, int]:
     """Calculate size of multiline text fragment
 
     Args:
-        frame: Multiline text fragment.
+        frame: Multiline text fragment or sprite.
 
     Returns:
         Pair — number of rows and columns.
     """
 
+    if isinstance(frame, Sprite):
+        return frame.size
+
     lines = frame.splitlines()
     rows = len(lines)
     columns = max([len(line) for line in lines])
     return rows, columns
 
 
-def get_max_frames_size(frames: list[str]) -> tuple[int, int]:
+def get_max_frames_size(frames: list[str | Sprite]) -> tuple[int, int]:
     """Calculate max size of multiline text for each of the coordinates.
 
     Args:
-        frames: Multiline text.
+        frames: Multiline texts or sprites.
 
     Returns:
         Pair — number of rows and columns.
@@ -0,0 +1,275 @@
+from array import array
+
+from curses_tools import beep
+from curses_tools import draw_frame
+from curses_tools import get_max_frames_size
+from curses_tools import Sprite
+from frame_buffer import FrameBuffer
+from obstacles import Obstacle
+from obstacles import ObstaclesGrid
+
+GARBAGE = 0
+EXPLOSION = 1
+
+
+class Entities:
+    """Struct of arrays store of garbage and explosions.
+
+    Every entity is a slot in parallel arrays of kinds, positions,
+    speeds, sizes, sprite ids and lifetimes. A removed entity is
+    replaced by the next alive one, so arrays stay contiguous. One
+    `update` call moves, culls and expires all entities and explodes
+    garbage hit by shots.
+
+    Args:
+        obstacles: Grid to register garbage as obstacles in.
+    """
+
+    def __init__(self, obstacles: ObstaclesGrid) -> None:
+        self.obstacles = obstacles
+        self.sprites: list[Sprite] = []
+        self.explosion_animation: int | None = None
+        # draw only every n-th explosion frame, e.g. under load
+        self.explosion_frames_step = 1
+
+        self._animations: list[tuple[int, int, int, int]] = []
+
+        self.kinds = array('B')
+        self.rows = array('d')
+        self.columns = array('d')
+        self.rows_speed = array('d')
+        self.columns_speed = array('d')
+        self.rows_size = array('H')
+        self.columns_size = array('H')
+        self.sprite_ids = array('H')
+        self.frames_counts = array('H')
+        self.still_tics = array('H')
+        self.ages = array('L')
+        self.lifetimes = array('l')  # -1 — entity lives until culled
+        # garbage is also an obstacle, other entities have None here
+        self.entities_obstacles: list[Obstacle | None] = []
+
+        self._columns = (
+            self.kinds,
+            self.rows,
+            self.columns,
+            self.rows_speed,
+            self.columns_speed,
+            self.rows_size,
+            self.columns_size,
+            self.sprite_ids,
+            self.frames_counts,
+            self.still_tics,
+            self.ages,
+            self.lifetimes,
+            self.entities_obstacles,
+        )
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def count(self, kind: int) -> int:
+        """Get number of entities of a kind.
+
+        Args:
+            kind: GARBAGE or EXPLOSION.
+        """
+
+        return self.kinds.count(kind)
+
+    def add_animation(self, sprites: list[Sprite]) -> int:
+        """Register animation, its frames change every tic.
+
+        Args:
+            sprites: Animation frames, the last one stays until
+                entity is removed.
+
+        Returns:
+            Animation id.
+        """
+
+        rows, columns = get_max_frames_size(sprites)
+        self._animations.append(
+            (len(self.sprites), len(sprites), rows, columns)
+        )
+        self.sprites.extend(sprites)
+        return len(self._animations) - 1
+
+    def get_animation_size(self, animation: int) -> tuple[int, int]:
+        """Get max size of animation frames.
+
+        Args:
+            animation: Animation id.
+
+        Returns:
+            Pair — number of rows and columns.
+        """
+
+        _, _, rows, columns = self._animations[animation]
+        return rows, columns
+
+    def add(
+        self,
+        kind: int,
+        row: float,
+        column: float,
+        animation: int,
+        rows_speed: float = 0,
+        columns_speed: float = 0,
+        still_tics: int = 0,
+        lifetime: int = -1,
+    ) -> None:
+        """Add entity, it's drawn in the nearest `draw` call.
+
+        Args:
+            kind: GARBAGE or EXPLOSION;
+            row: Left upper row position;
+            column: Left upper column position;
+            animation: Animation id;
+            rows_speed: Vertical speed;
+            columns_speed: Horizontal speed;
+            still_tics: Number of tics before entity starts moving;
+            lifetime: Number of tics before entity is removed,
+                -1 to remove it only when it leaves the window.
+        """
+
+        sprite_id, frames_count, rows_size, columns_size = self._animations[
+            animation
+        ]
+
+        obstacle = None
+        if kind == GARBAGE:
+            obstacle = Obstacle(row, column, rows_size, columns_size)
+            self.obstacles.add(obstacle)
+
+        values = (
+            kind,
+            row,
+            column,
+            rows_speed,
+            columns_speed,
+            rows_size,
+            columns_size,
+            sprite_id,
+            frames_count,
+            still_tics,
+            0,
+            lifetime,
+            obstacle,
+        )
+        for values_column, value in zip(self._columns, values):
+            values_column.append(value)
+
+    def add_explosion(self, center_row: float, center_column: float) -> None:
+        """Add explosion animation.
+
+        Args:
+            center_row: Row position of explosion center;
+            center_column: Column position of explosion center.
+        """
+
+        animation = self.explosion_animation
+        _, frames_count, rows, columns = self._animations[animation]
+        self.add(
+            EXPLOSION,
+            center_row - rows / 2,
+            center_column - columns / 2,
+            animation,
+            lifetime=frames_count,
+        )
+        beep()
+
+    def draw(self, canvas: FrameBuffer) -> None:
+        """Draw current frames of all entities.
+
+        Args:
+            canvas: Frame buffer of main window.
+        """
+
+        sprites = self.sprites
+        sprite_ids, frames_counts, ages = (
+            self.sprite_ids,
+            self.frames_counts,
+            self.ages,
+        )
+        rows, columns = self.rows, self.columns
+        kinds, explosion_frames_step = self.kinds, self.explosion_frames_step
+        for index in range(len(sprite_ids)):
+            is_skipped_frame = ages[index] % explosion_frames_step
+            if is_skipped_frame and kinds[index] == EXPLOSION:
+                continue
+
+            frame = min(ages[index], frames_counts[index] - 1)
+            sprite = sprites[sprite_ids[index] + frame]
+            draw_frame(canvas, rows[index], columns[index], sprite)
+
+    def update(self, rows_number: int, columns_number: int) -> None:
+        """Move, cull and expire all entities, explode hit garbage.
+
+        Entities are culled as soon as they leave the area inside
+        the window border.
+
+        Args:
+            rows_number: Number of window rows;
+            columns_number: Number of window columns.
+        """
+
+        kinds, rows, columns = self.kinds, self.rows, self.columns
+        rows_speed, columns_speed = self.rows_speed, self.columns_speed
+        rows_size, columns_size = self.rows_size, self.columns_size
+        still_tics, ages, lifetimes = (
+            self.still_tics,
+            self.ages,
+            self.lifetimes,
+        )
+        entities_obstacles = self.entities_obstacles
+        obstacles = self.obstacles
+        max_row, max_column = rows_number - 1, columns_number - 1
+
+        explosions = []
+        alive_count = 0
+        for index in range(len(kinds)):
+            obstacle = entities_obstacles[index]
+            age = ages[index] + 1
+            row, column = rows[index], columns[index]
+
+            is_alive = lifetimes[index] < 0 or age < lifetimes[index]
+            if obstacle is not None and obstacle.is_hit:
+                is_alive = False
+                explosions.append(
+                    (
+                        row + rows_size[index] // 2,
+                        column + columns_size[index] // 2,
+                    )
+                )
+
+            if is_alive and age >= still_tics[index]:
+                row += rows_speed[index]
+                column += columns_speed[index]
+                is_row_inside = 1 - rows_size[index] < row < max_row
+                is_column_inside = (
+                    1 - columns_size[index] < column < max_column
+                )
+                is_alive = is_row_inside and is_column_inside
+
+            if not is_alive:
+                if obstacle is not None:
+                    obstacles.remove(obstacle)
+                continue
+
+            if obstacle is not None:
+                obstacle.row, obstacle.column = row, column
+                obstacles.update(obstacle)
+
+            ages[index] = age
+            rows[index], columns[index] = row, column
+            if alive_count != index:
+                for values_column in self._columns:
+                    values_column[alive_count] = values_column[index]
+            alive_count += 1
+
+        for values_column in self._columns:
+            del values_column[alive_count:]
+
+        for center_row, center_column in explosions:
+            self.add_explosion(center_row, center_column)
@@ -1,34 +1,20 @@
-import asyncio
-import curses
+from curses_tools import Sprite
 
-from curses_tools import draw_frame
-from curses_tools import get_max_frames_size
 
+def get_explosion_animation(frames: list[Sprite]) -> list[Sprite]:
+    """Get frames of obstacle explosion animation.
 
-async def explode(
-    canvas: curses.window,
-    center_row: int,
-    center_column: int,
-    frames: list[str],
-) -> None:
-    """Animate obstacle explosion.
+    Every frame is shown for one tic and hidden for the next one.
 
     Args:
-        canvas: Main window;
-        center_row: Current row position;
-        center_column: Current column position
-        frames: List of obstacle explosion animations;
-    """
+        frames: List of obstacle explosion frames.
 
-    # get the coordinates of the upper left corner for rendering the animation
-    rows, columns = get_max_frames_size(frames)
-    corner_row = center_row - rows / 2
-    corner_column = center_column - columns / 2
+    Returns:
+        Frames for each tic of animation.
+    """
 
-    curses.beep()
+    blank = Sprite('')
+    animation = []
     for frame in frames:
-        draw_frame(canvas, corner_row, corner_column, frame)
-        await asyncio.sleep(0)
-
-        draw_frame(canvas, corner_row, corner_column, frame, negative=True)
-        await asyncio.sleep(0)
+        animation.extend([frame, blank])
+    return animation
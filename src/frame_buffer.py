@@ -0,0 +1,272 @@
+import curses
+
+from headless import HeadlessCanvas
+from viewport import Viewport
+
+Cell = tuple[str, int]
+
+BLANK_CELL = (' ', curses.A_NORMAL)
+
+
+class FrameBuffer:
+    """Double buffer between game coroutines and the main window.
+
+    Coroutines submit what they want to draw in the current tic into
+    the back buffer, so nothing has to be erased in the next tic.
+    Background cells (stars) stay on the screen until they are painted
+    over. Overlay cells (border, HUD) stay on top of everything until
+    they are pinned over. At the end of the tic the compositor diffs
+    the back buffer with the front one and sends only changed cells
+    to curses.
+
+    Buffer size follows the viewport. When the window is resized,
+    background and overlay are dropped and the window is redrawn,
+    so their owners have to draw them again.
+
+    Args:
+        canvas: Main window or its in-memory replacement;
+        viewport: Viewport of the window.
+    """
+
+    def __init__(
+        self,
+        canvas: curses.window | HeadlessCanvas,
+        viewport: Viewport | None = None,
+    ) -> None:
+        self.canvas = canvas
+        self.viewport = viewport or Viewport(canvas)
+        self._resizes = self.viewport.resizes
+        self._has_border = False
+
+        self._back: dict[tuple[int, int], Cell] = {}
+        self._background: dict[tuple[int, int], Cell] = {}
+        self._overlay: dict[tuple[int, int], Cell] = {}
+        self._front: dict[tuple[int, int], Cell] = {}
+        # cells which may differ from the front buffer in the next tic
+        self._dirty: set[tuple[int, int]] = set()
+
+    @property
+    def rows(self) -> int:
+        return self.viewport.rows
+
+    @property
+    def columns(self) -> int:
+        return self.viewport.columns
+
+    def getmaxyx(self) -> tuple[int, int]:
+        return self.viewport.rows, self.viewport.columns
+
+    def getch(self) -> int:
+        return self.canvas.getch()
+
+    def _get_cells(
+        self,
+        row: int,
+        column: int,
+        text: str,
+        attr: int,
+    ) -> list[tuple[tuple[int, int], Cell]]:
+        """Get cells of a text line clipped by the window.
+
+        Args:
+            row: Row position of text;
+            column: Column position of the first symbol;
+            text: Symbols to place;
+            attr: Symbols attributes.
+
+        Returns:
+            List of cell positions with cell values.
+        """
+
+        viewport = self.viewport
+        if self._resizes != viewport.resizes:
+            self._fit_viewport()
+
+        rows = viewport.rows
+        if row < 0 or row >= rows:
+            return []
+
+        # the last cell of the window can't be drawn
+        max_column = viewport.columns - (row == rows - 1)
+        return [
+            ((row, cell_column), (symbol, attr))
+            for cell_column, symbol in enumerate(text, column)
+            if 0 <= cell_column < max_column
+        ]
+
+    def addstr(
+        self,
+        row: int,
+        column: int,
+        text: str,
+        attr: int = curses.A_NORMAL,
+    ) -> None:
+        """Draw text in the current tic.
+
+        Args:
+            row: Row position of text;
+            column: Column position of the first symbol;
+            text: Symbols to draw;
+            attr: Symbols attributes.
+        """
+
+        self._back.update(self._get_cells(row, column, text, attr))
+
+    def addch(
+        self,
+        row: int,
+        column: int,
+        symbol: str,
+        attr: int = curses.A_NORMAL,
+    ) -> None:
+        """Draw symbol in the current tic.
+
+        Args:
+            row: Row position of symbol;
+            column: Column position of symbol;
+            symbol: Symbol to draw;
+            attr: Symbol attributes.
+        """
+
+        self.addstr(row, column, symbol, attr)
+
+    def paint(
+        self,
+        row: int,
+        column: int,
+        text: str,
+        attr: int = curses.A_NORMAL,
+    ) -> None:
+        """Draw text on the background, it stays until painted over.
+
+        Args:
+            row: Row position of text;
+            column: Column position of the first symbol;
+            text: Symbols to paint;
+            attr: Symbols attributes.
+        """
+
+        cells = self._get_cells(row, column, text, attr)
+        self._background.update(cells)
+        self._dirty.update(position for position, _ in cells)
+
+    def pin(
+        self,
+        row: int,
+        column: int,
+        text: str,
+        attr: int = curses.A_NORMAL,
+    ) -> None:
+        """Draw text over the frame, it stays until pinned over.
+
+        Spaces of text are transparent, they unpin cells under them,
+        so text pinned over a longer one should be padded with spaces.
+
+        Args:
+            row: Row position of text;
+            column: Column position of the first symbol;
+            text: Symbols to pin;
+            attr: Symbols attributes.
+        """
+
+        overlay = self._overlay
+        for position, cell in self._get_cells(row, column, text, attr):
+            if cell[0] == ' ':
+                overlay.pop(position, None)
+            else:
+                overlay[position] = cell
+            self._dirty.add(position)
+
+    def border(self) -> None:
+        """Pin window border over the frame, so sprites never cover it."""
+
+        self._has_border = True
+        last_row, last_column = self.rows - 1, self.columns - 1
+        horizontal_line = '+' + '-' * (last_column - 1) + '+'
+        self.pin(0, 0, horizontal_line)
+        self.pin(last_row, 0, horizontal_line)
+        for row in range(1, last_row):
+            self.pin(row, 0, '|')
+            self.pin(row, last_column, '|')
+
+    def _fit_viewport(self) -> None:
+        """Drop cells laid out for the old window size."""
+
+        self._resizes = self.viewport.resizes
+        rows, columns = self.rows, self.columns
+
+        # window content is undefined after resize, so redraw it all
+        self.canvas.clear()
+        self._front = {}
+        self._background = {}
+        self._overlay = {}
+        self._back = {
+            (row, column): cell
+            for (row, column), cell in self._back.items()
+            if row < rows and column < columns - (row == rows - 1)
+        }
+        self._dirty = set(self._back)
+        if self._has_border:
+            self.border()
+
+    def compose(self) -> list[tuple[int, int, str, int]]:
+        """Finish the tic and get cells changed since the previous one.
+
+        Returns:
+            List of changed cells: row, column, symbol and attributes.
+        """
+
+        if self._resizes != self.viewport.resizes:
+            self._fit_viewport()
+
+        back, background, front = self._back, self._background, self._front
+        overlay = self._overlay
+        dirty = self._dirty
+        dirty.update(back)
+
+        changes = []
+        for position in dirty:
+            cell = overlay.get(position) or back.get(position)
+            if cell is None:
+                cell = background.get(position, BLANK_CELL)
+            if front.get(position, BLANK_CELL) == cell:
+                continue
+
+            changes.append((*position, *cell))
+            if cell == BLANK_CELL:
+                del front[position]
+            else:
+                front[position] = cell
+
+        # cells of this tic have to be cleared in the next one
+        self._dirty = set(back)
+        self._back = {}
+
+        changes.sort()
+        return changes
+
+    def discard(self) -> None:
+        """Finish the tic without sending changed cells to the window.
+
+        Cells stay dirty, so the next `compose` sends them.
+        """
+
+        self._dirty.update(self._back)
+        self._back = {}
+
+    def present(self) -> list[tuple[int, int, str, int]]:
+        """Send changed cells to the main window and refresh it.
+
+        Returns:
+            List of changed cells: row, column, symbol and attributes.
+        """
+
+        changes = self.compose()
+        for row, column, symbol, attr in changes:
+            try:
+                self.canvas.addstr(row, column, symbol, attr)
+            except curses.error:
+                # window shrank during the tic, the next tic redraws it
+                pass
+        self.canvas.refresh()
+        return changes
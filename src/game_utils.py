@@ -1,8 +1,9 @@
-import asyncio
 import os
 import random
 import typing
 
+from curses_tools import Sprite
+
 
 def get_symbol_coordinates(
     max_row: int,
@@ -27,29 +28,47 @@ def get_symbol_coordinates(
     return coordinates
 
 
+class TicsSleep:
+    """Awaitable suspending coroutine for a number of tics.
+
+    Yields number of tics to the scheduler once, so the scheduler can
+    park the coroutine until its wake tic instead of resuming it
+    every tic.
+
+    Args:
+        tics: Number of tics to sleep.
+    """
+
+    def __init__(self, tics: int) -> None:
+        self.tics = tics
+
+    def __await__(self) -> typing.Generator[int, None, None]:
+        if self.tics > 0:
+            yield self.tics
+
+
 async def make_delay(delay: int) -> None:
     """Make animation delay.
 
     Args:
-        delay: Delay value.
+        delay: Delay value in tics.
     """
 
-    for _ in range(delay):
-        await asyncio.sleep(0)
+    await TicsSleep(delay)
 
 
-def get_frames(frames_folder_path: str) -> dict[str, list[str]]:
+def get_frames(frames_folder_path: str) -> dict[str, list[Sprite]]:
     """Get game frames.
 
     Args:
         frames_folder_path: Path to folder with game frames.
 
     Returns:
-        Dict with list of frames for each animation.
+        Dict with list of compiled frames for each animation.
     """
 
     frames = {}
-    for file_name in os.listdir(frames_folder_path):
+    for file_name in sorted(os.listdir(frames_folder_path)):
         file_path = os.path.join(frames_folder_path, file_name)
         if not os.path.isfile(file_path):
             continue
@@ -57,14 +76,14 @@ def get_frames(frames_folder_path: str) -> dict[str, list[str]]:
         with open(file_path) as frame_file:
             frame = frame_file.read()
         frame_type, *_ = file_name.split('_')
-        frames.setdefault(frame_type, []).append(frame)
+        frames.setdefault(frame_type, []).append(Sprite(frame))
     return frames
 
 
 def get_frame_per_tic(
-    frames: list[str],
+    frames: list[Sprite],
     tic_count: int = 2,
-) -> typing.Generator[str, None, None]:
+) -> typing.Generator[Sprite, None, None]:
     """Get frame per tic.
 
     Args:
@@ -0,0 +1,149 @@
+import collections
+import curses
+import typing
+from array import array
+
+
+class HeadlessCanvas:
+    """In-memory replacement of the curses window.
+
+    Supports the part of `curses.window` interface used by the game,
+    so the game can run without a terminal. Cells are kept in two flat
+    arrays — code points of symbols and attributes. Pressed keys are
+    taken from a scripted queue, -1 in the queue ends keys of
+    the current tic the same way as an empty queue does.
+
+    Args:
+        rows: Number of window rows;
+        columns: Number of window columns;
+        keys: Scripted codes of pressed keys.
+    """
+
+    def __init__(
+        self,
+        rows: int = 24,
+        columns: int = 80,
+        keys: typing.Iterable[int] = (),
+    ) -> None:
+        self.rows = rows
+        self.columns = columns
+        self.clear()
+        self.keys = collections.deque(keys)
+        self.refreshes = 0
+
+    def getmaxyx(self) -> tuple[int, int]:
+        return self.rows, self.columns
+
+    def nodelay(self, flag: bool) -> None:
+        pass
+
+    def keypad(self, flag: bool) -> None:
+        pass
+
+    def refresh(self) -> None:
+        self.refreshes += 1
+
+    def clear(self) -> None:
+        """Blank all cells."""
+
+        self.symbols = array('I', [ord(' ')]) * (self.rows * self.columns)
+        self.attrs = array('L', [curses.A_NORMAL]) * (self.rows * self.columns)
+
+    def resize(self, rows: int, columns: int) -> None:
+        """Change window size, window content is lost.
+
+        Args:
+            rows: Number of window rows;
+            columns: Number of window columns.
+        """
+
+        self.rows, self.columns = rows, columns
+        self.clear()
+
+    def push_keys(self, *key_codes: int) -> None:
+        """Add codes of pressed keys to the queue.
+
+        Args:
+            key_codes: Key codes, -1 ends keys of a tic.
+        """
+
+        self.keys.extend(key_codes)
+
+    def getch(self) -> int:
+        """Get code of pressed key, -1 if there are no keys."""
+
+        if not self.keys:
+            return -1
+        return self.keys.popleft()
+
+    def addstr(
+        self,
+        row: int,
+        column: int,
+        text: str,
+        attr: int = curses.A_NORMAL,
+    ) -> None:
+        """Write text to the cells.
+
+        Args:
+            row: Row position of text;
+            column: Column position of the first symbol;
+            text: Symbols to write;
+            attr: Symbols attributes.
+
+        Raises:
+            curses.error: If text is out of the window.
+        """
+
+        start = row * self.columns + column
+        end = start + len(text)
+        is_inside = 0 <= row < self.rows and 0 <= column < self.columns
+        # as curses does, don't allow to move cursor out of the last cell
+        if not is_inside or end >= len(self.symbols):
+            raise curses.error('addstr() returned ERR')
+
+        if end - start == 1:
+            # frame buffer sends cells one by one
+            self.symbols[start] = ord(text)
+            self.attrs[start] = attr
+            return
+        self.symbols[start:end] = array('I', map(ord, text))
+        self.attrs[start:end] = array('L', [attr]) * len(text)
+
+    def addch(
+        self,
+        row: int,
+        column: int,
+        symbol: str,
+        attr: int = curses.A_NORMAL,
+    ) -> None:
+        self.addstr(row, column, symbol, attr)
+
+    def border(self) -> None:
+        last_row, last_column = self.rows - 1, self.columns - 1
+        horizontal_line = '+' + '-' * (last_column - 1) + '+'
+        self.addstr(0, 0, horizontal_line)
+        self.addstr(last_row, 0, horizontal_line[:-1])
+        for row in range(1, last_row):
+            self.addstr(row, 0, '|')
+            self.addstr(row, last_column, '|')
+
+    def get_cell(self, row: int, column: int) -> tuple[str, int]:
+        """Get symbol and attributes of a cell.
+
+        Args:
+            row: Cell row;
+            column: Cell column.
+        """
+
+        index = row * self.columns + column
+        return chr(self.symbols[index]), self.attrs[index]
+
+    def get_text(self) -> str:
+        """Get window content as multiline text."""
+
+        text = ''.join(map(chr, self.symbols))
+        return '\n'.join(
+            text[start : start + self.columns]
+            for start in range(0, len(text), self.columns)
+        )
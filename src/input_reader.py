@@ -0,0 +1,107 @@
+import collections
+import curses
+import selectors
+import time
+
+from curses_tools import parse_controls
+from headless import HeadlessCanvas
+
+
+class InputReader:
+    """Keyboard events queue filled as keys arrive.
+
+    While the game waits for the next tic, the reader watches stdin
+    and moves pressed keys from curses into the queue at once, with
+    the time they arrived. The ship takes all keys pressed since
+    the previous tic, so no press is lost and input doesn't wait for
+    the tic to be noticed. Without stdin (e.g. for in-memory window)
+    keys are taken from the window when controls are read. Terminal
+    resize is only taken from the queue, the new size is read at
+    the start of the next tic, so a recorded session can replay it
+    at the same point.
+
+    Args:
+        canvas: Main window or its in-memory replacement;
+        fileno: File descriptor of stdin, None to not watch it.
+    """
+
+    def __init__(
+        self,
+        canvas: curses.window | HeadlessCanvas,
+        fileno: int | None = None,
+    ) -> None:
+        self.canvas = canvas
+        self.events: collections.deque[tuple[float, int]] = collections.deque()
+
+        self.events_count = 0
+        self.max_latency = 0.0
+        self.total_latency = 0.0
+
+        self._selector = None
+        if fileno is not None:
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(fileno, selectors.EVENT_READ)
+
+    @property
+    def average_latency(self) -> float:
+        """Average time from key press to its handling in seconds."""
+
+        if not self.events_count:
+            return 0.0
+        return self.total_latency / self.events_count
+
+    def poll(self) -> None:
+        """Move keys pressed so far from the window to the queue."""
+
+        while True:
+            pressed_key_code = self.canvas.getch()
+            if pressed_key_code == -1:
+                break
+
+            # curses has already read the new window size
+            if pressed_key_code == curses.KEY_RESIZE:
+                continue
+            self.events.append((time.monotonic(), pressed_key_code))
+
+    def wait(self, timeout: float) -> None:
+        """Sleep, meanwhile queue keys as soon as they are pressed.
+
+        Args:
+            timeout: Time to sleep in seconds.
+        """
+
+        if self._selector is None:
+            time.sleep(timeout)
+            return
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if self._selector.select(remaining):
+                self.poll()
+
+    def get_controls(self) -> tuple[int, int, int]:
+        """Take all queued keys as controls state of the tic.
+
+        Returns:
+            Rows direction, columns direction and number of fire presses.
+        """
+
+        self.poll()
+
+        now = time.monotonic()
+        for timestamp, _ in self.events:
+            latency = now - timestamp
+            self.max_latency = max(self.max_latency, latency)
+            self.total_latency += latency
+        self.events_count += len(self.events)
+
+        controls = parse_controls(key_code for _, key_code in self.events)
+        self.events.clear()
+        return controls
+
+    def close(self) -> None:
+        if self._selector is not None:
+            self._selector.close()
@@ -0,0 +1,81 @@
+# for each level — stars update period, explosion frames step
+# and HUD update period; explosion animation interleaves frames
+# with blank ones, so step 4 skips every other visible frame
+DETAIL_LEVELS = [
+    (1, 1, 1),
+    (2, 1, 5),
+    (4, 4, 10),
+    (8, 4, 20),
+]
+
+
+class LoadGovernor:
+    """Level of cosmetic detail chosen by tic work time.
+
+    Governor keeps moving average of tic work time. When it exceeds
+    the high share of tic period, cosmetic work is shed one level
+    after another, when it falls below the low share, detail is
+    restored. After each change the governor waits for the average
+    to follow before the next change.
+
+    Args:
+        tic_timeout: Tic period in seconds;
+        high_load: Share of tic period to shed detail above;
+        low_load: Share of tic period to restore detail below;
+        patience_tics: Number of tics between level changes.
+    """
+
+    def __init__(
+        self,
+        tic_timeout: float,
+        high_load: float = 0.8,
+        low_load: float = 0.4,
+        patience_tics: int = 10,
+    ) -> None:
+        self.max_work_time = tic_timeout * high_load
+        self.min_work_time = tic_timeout * low_load
+        self.patience_tics = patience_tics
+
+        self.level = 0
+        self.average_work_time = 0.0
+        self._calm_tics = 0
+
+    @property
+    def stars_period(self) -> int:
+        """Number of tics between stars updates."""
+
+        return DETAIL_LEVELS[self.level][0]
+
+    @property
+    def explosion_frames_step(self) -> int:
+        """Draw only every n-th explosion animation frame."""
+
+        return DETAIL_LEVELS[self.level][1]
+
+    @property
+    def hud_period(self) -> int:
+        """Number of tics between HUD updates."""
+
+        return DETAIL_LEVELS[self.level][2]
+
+    def update(self, work_time: float) -> None:
+        """Take work time of the finished tic and adjust detail level.
+
+        Args:
+            work_time: Tic work time in seconds.
+        """
+
+        self.average_work_time += (work_time - self.average_work_time) / 8
+
+        self._calm_tics += 1
+        if self._calm_tics < self.patience_tics:
+            return
+
+        if self.average_work_time > self.max_work_time:
+            if self.level < len(DETAIL_LEVELS) - 1:
+                self.level += 1
+                self._calm_tics = 0
+        elif self.average_work_time < self.min_work_time:
+            if self.level > 0:
+                self.level -= 1
+                self._calm_tics = 0
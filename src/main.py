@@ -1,302 +1,288 @@
+import argparse
 import asyncio
 import curses
+import multiprocessing
 import random
+import resource
+import sys
 import time
+import typing
 from itertools import cycle
+from multiprocessing.connection import Connection
 from statistics import median
 
 import config
+from ansi_terminal import AnsiTerminal
+from asset_pack import load_asset_pack
+from coroutines_stats import CoroutinesStats
+from coroutines_stats import show_coroutines_stats
+from curses_tools import beep
 from curses_tools import draw_frame
 from curses_tools import get_frame_size
 from curses_tools import get_max_frames_size
-from curses_tools import read_controls
-from explosion import explode
+from curses_tools import set_bell
+from curses_tools import Sprite
+from entities import Entities
+from entities import EXPLOSION
+from entities import GARBAGE
+from explosion import get_explosion_animation
+from frame_buffer import FrameBuffer
 from game_scenario import get_garbage_delay_tics
 from game_scenario import PHRASES
 from game_utils import get_frame_per_tic
-from game_utils import get_frames
 from game_utils import get_symbol_coordinates
 from game_utils import make_delay
-from obstacles import Obstacle
+from headless import HeadlessCanvas
+from input_reader import InputReader
+from load_governor import LoadGovernor
+from obstacles import Boxes
+from obstacles import find_collisions
+from obstacles import ObstaclesGrid
 from physics import update_speed
-
-COROUTINES = []
-OBSTACLES = []
-OBSTACLES_IN_LAST_COLLISIONS = []
+from projectiles import Projectiles
+from recording import Recording
+from scheduler import Scheduler
+from shared_frames import FrameRing
+from shared_frames import render_frames
+from shared_frames import SharedFrameCanvas
+from ships import Ships
+from ships import steer_bots
+from spectators import serve_spectators
+from spectators import SpectatorServer
+from star_field import animate_star_field
+from star_field import StarField
+from tic_barrier import TicBarrier
+from tic_clock import TicClock
+from viewport import Viewport
+
+SCHEDULER = Scheduler()
+OBSTACLES = ObstaclesGrid()
+ENTITIES = Entities(OBSTACLES)
+PROJECTILES = Projectiles(OBSTACLES, config.MAX_SHOTS)
+BOT_PROJECTILES = Projectiles(OBSTACLES, config.MAX_BOT_SHOTS)
 YEAR = 1957
 
 
-async def animate_star_blink(
-    canvas: curses.window,
-    row: int,
-    column: int,
-    symbol: str = '*',
-    delay: int = 0,
+def fire(
+    start_row: float,
+    start_column: float,
+    rows_speed: float = -0.3,
+    columns_speed: float = 0,
 ) -> None:
-    """Animate twinkling star.
+    """Launch spaceship fire.
 
     Args:
-        canvas: Main window;
-        row: Current row position of star;
-        column: Current column position of star
-        symbol: Star symbol;
-        delay: Delay in star twinkling.
-    """
-
-    await make_delay(delay)
-
-    brightness_per_delay = [
-        (curses.A_DIM, 20),
-        (curses.A_NORMAL, 3),
-        (curses.A_BOLD, 5),
-        (curses.A_NORMAL, 3),
-    ]
-
-    while True:
-        for brightness, delay in brightness_per_delay:
-            canvas.addstr(row, column, symbol, brightness)
-            await make_delay(delay)
-
-
-async def animate_fire(
-    canvas: curses.window,
-    start_row: int,
-    start_column: int,
-    rows_speed: int = -0.3,
-    columns_speed: int = 0,
-) -> None:
-    """Animate spaceship fire.
-
-    Args:
-        canvas: Main window;
         start_row: Start row position of fire;
         start_column: Start column position of fire;
         rows_speed: Vertical speed;
         columns_speed: Horizontal speed.
     """
 
-    row, column = start_row, start_column
-
-    canvas.addstr(round(row), round(column), '*')
-    await asyncio.sleep(0)
-
-    canvas.addstr(round(row), round(column), 'O')
-    await asyncio.sleep(0)
-    canvas.addstr(round(row), round(column), ' ')
-
-    row += rows_speed
-    column += columns_speed
-
-    symbol = '-' if columns_speed else '|'
-
-    # legacy curses feature, returns wrong values
-    rows, columns = canvas.getmaxyx()
-
-    max_row, max_column = (
-        rows - 1,
-        columns - 1,
-    )  # the coordinates of the last cell are 1 smaller
-
-    curses.beep()
-
-    while 0 < row < max_row and 0 < column < max_column:
-        canvas.addstr(round(row), round(column), symbol)
-        await asyncio.sleep(0)
-        canvas.addstr(round(row), round(column), ' ')
-        row += rows_speed
-        column += columns_speed
-
-        for obstacle in OBSTACLES:
-            # Handle collision with obstacles
-            if obstacle.has_collision(row, column):
-                OBSTACLES_IN_LAST_COLLISIONS.append(obstacle)
-                return
+    if PROJECTILES.fire(start_row, start_column, rows_speed, columns_speed):
+        beep()
 
 
 async def animate_spaceship(
-    canvas: curses.window,
+    canvas: FrameBuffer,
     row: int,
     column: int,
-    spaceship_frames: list[str],
-    gameover_frame: str,
+    spaceship_frames: list[Sprite],
+    gameover_frame: Sprite,
+    input_reader: InputReader,
+    recording: Recording | None = None,
 ) -> None:
     """Animate spaceship in current position.
 
     Args:
-        canvas: Main window;
+        canvas: Frame buffer of main window;
         row: Current position row;
         column: Current position column;
         spaceship_frames: List of spaceship animations;
-        gameover_frame: Frame for gameover inscription.
+        gameover_frame: Frame for gameover inscription;
+        input_reader: Queue of pressed keys;
+        recording: Recording to add controls states to.
     """
 
     current_row, current_column = row, column
     min_row = min_column = 1
+    viewport = canvas.viewport
 
-    # legacy curses feature, returns wrong values
-    rows, columns = canvas.getmaxyx()
-
-    max_row, max_column = (
-        rows - 1,
-        columns - 1,
-    )  # the coordinates of the last cell are 1 smaller
     frame_rows, frame_columns = get_max_frames_size(spaceship_frames)
-    max_row -= frame_rows
-    max_column -= frame_columns
     row_speed = column_speed = 0
+    queued_shots = 0
 
     for frame in cycle(get_frame_per_tic(spaceship_frames)):
-        row_offset, column_offset, space_pressed = read_controls(canvas)
+        row_offset, column_offset, fire_presses = input_reader.get_controls()
+        if recording is not None:
+            recording.record(row_offset, column_offset, fire_presses)
         row_speed, column_speed = update_speed(
             row_speed, column_speed, row_offset, column_offset
         )
 
+        # bounds are read every tic as the window may be resized
+        max_row = viewport.max_row - frame_rows
+        max_column = viewport.max_column - frame_columns
         current_row = median([min_row, current_row + row_speed, max_row])
         current_column = median(
             [min_column, current_column + column_speed, max_column]
         )
 
-        if space_pressed and YEAR > config.FIRE_START_YEAR:
+        # presses of one tic fire in the next tics instead of stacking
+        queued_shots = min(
+            queued_shots + fire_presses, config.MAX_QUEUED_SHOTS
+        )
+        if YEAR <= config.FIRE_START_YEAR:
+            queued_shots = 0
+        if queued_shots:
             fire_column = (
                 current_column + frame_columns // 2
             )  # as current_column points to the left edge of the frame
-            COROUTINES.append(animate_fire(canvas, current_row, fire_column))
+            fire(current_row, fire_column)
+            queued_shots -= 1
 
         draw_frame(canvas, current_row, current_column, frame)
         await asyncio.sleep(0)
-        draw_frame(canvas, current_row, current_column, frame, negative=True)
 
-        for obstacle in OBSTACLES:
-            # Handle collision with obstacles
-            if obstacle.has_collision(
-                current_row, current_column, frame_rows, frame_columns
-            ):
-                COROUTINES.append(show_gameover(canvas, gameover_frame))
-                return
+        # Handle collision with obstacles
+        if OBSTACLES.get_collisions(
+            current_row, current_column, frame_rows, frame_columns
+        ):
+            SCHEDULER.spawn(show_gameover(canvas, gameover_frame))
+            return
 
 
-async def fill_orbit_with_garbage(
-    canvas: curses.window,
-    garbage_frames: list[str],
-    explosion_frames: list[str],
+async def animate_bots(
+    canvas: FrameBuffer,
+    bots_count: int,
+    bot_frames: list[Sprite],
 ) -> None:
-    """Animate stream of garbage
+    """Animate bot ships hunting garbage, e.g. to load test the game.
 
     Args:
-        canvas: Main window;
-        garbage_frames: List of garbage animations;
-        explosion_frames: List of garbage explosion animations.
+        canvas: Frame buffer of main window;
+        bots_count: Number of bot ships;
+        bot_frames: List of bot ship animations.
     """
 
-    # legacy curses feature, returns wrong values
-    rows_number, columns_number = canvas.getmaxyx()
+    viewport = canvas.viewport
+    rows_number, columns_number = viewport.getmaxyx()
 
-    max_row, max_column = (
-        rows_number - 1,
-        columns_number - 1,
-    )  # the coordinates of the last cell are 1 smaller
+    frame_rows, frame_columns = get_max_frames_size(bot_frames)
+    ships = Ships(frame_rows, frame_columns)
+    for _ in range(bots_count):
+        ships.add(
+            random.uniform(rows_number / 2, rows_number - 1 - frame_rows),
+            random.uniform(1, columns_number - 1 - frame_columns),
+        )
 
-    while True:
-        column = get_symbol_coordinates(max_row, max_column)['column']
-        frame = random.choice(garbage_frames)
-        delay = get_garbage_delay_tics(YEAR)
-        if not delay:
-            await make_delay(1)
-            continue
+    rng = random.Random(random.random())  # follows the game seed
+    for frame in cycle(get_frame_per_tic(bot_frames)):
+        rows_number, columns_number = viewport.getmaxyx()
+        for index in steer_bots(ships, OBSTACLES, columns_number, rng):
+            if YEAR <= config.FIRE_START_YEAR:
+                continue
+            BOT_PROJECTILES.fire(
+                ships.rows[index],
+                ships.columns[index] + frame_columns // 2,
+                rows_speed=-0.3,
+            )
+        ships.move(rows_number, columns_number)
 
-        COROUTINES.append(
-            animate_garbage(canvas, column, frame, explosion_frames)
+        for row, column in zip(ships.rows, ships.columns):
+            draw_frame(canvas, row, column, frame)
+        await asyncio.sleep(0)
+
+        obstacles = list(OBSTACLES)
+        collisions = find_collisions(
+            Boxes(
+                [obstacle.row for obstacle in obstacles],
+                [obstacle.column for obstacle in obstacles],
+                [obstacle.rows_size for obstacle in obstacles],
+                [obstacle.columns_size for obstacle in obstacles],
+            ),
+            ships.get_boxes(),
         )
-        await make_delay(delay)
+        crashed = set()
+        for ship, obstacle in collisions:
+            obstacles[obstacle].is_hit = True
+            crashed.add(ship)
+        if crashed:
+            ships.remove(crashed)
+        if not ships:
+            return
 
 
-async def animate_garbage(
-    canvas: curses.window,
-    column: int,
-    garbage_frame: str,
-    explosion_frames: list[str],
+async def fill_orbit_with_garbage(
+    canvas: FrameBuffer,
+    garbage_animations: list[int],
     speed: float = 0.5,
 ) -> None:
-    """Animate garbage, flying from top to bottom.
-    Column position will stay same, as specified on start.
+    """Animate stream of garbage, flying from top to bottom.
 
     Args:
-        canvas: Main window;
-        column: Current column position;
-        garbage_frame: Frame for garbage animation;
-        explosion_frames: List of garbage explosion animations;
-        speed: Speed for garbage animation.
+        canvas: Frame buffer of main window;
+        garbage_animations: Animation ids of garbage;
+        speed: Speed of garbage.
     """
 
-    # legacy curses feature, returns wrong values
-    rows_number, columns_number = canvas.getmaxyx()
+    viewport = canvas.viewport
 
-    columns_number -= 1  # the coordinates of the last cell are 1 smaller
-    frame_rows, frame_columns = get_frame_size(garbage_frame)
-
-    column = median([0, column, columns_number - frame_columns])
-    row = 0
+    while True:
+        max_row, max_column = viewport.max_row, viewport.max_column
+        column = get_symbol_coordinates(max_row, max_column)['column']
+        animation = random.choice(garbage_animations)
+        delay = get_garbage_delay_tics(YEAR)
+        if not delay:
+            await make_delay(1)
+            continue
 
-    obstacle = Obstacle(row, column, frame_rows, frame_columns)
-    OBSTACLES.append(obstacle)
-    while row < rows_number:
-        draw_frame(canvas, row, column, garbage_frame)
-        await asyncio.sleep(0)
-        draw_frame(canvas, row, column, garbage_frame, negative=True)
-        row += speed
-        obstacle.row = row
-
-        if obstacle in OBSTACLES_IN_LAST_COLLISIONS:
-            OBSTACLES.remove(obstacle)
-            center_row = row + frame_rows // 2
-            center_column = column + frame_columns // 2
-            await explode(canvas, center_row, center_column, explosion_frames)
-            return
-    OBSTACLES.remove(obstacle)
+        _, frame_columns = ENTITIES.get_animation_size(animation)
+        column = median([0, column, max_column - frame_columns])
+        ENTITIES.add(GARBAGE, 0, column, animation, rows_speed=speed)
+        await make_delay(delay)
 
 
-async def show_gameover(canvas: curses.window, gameover_frame: str) -> None:
+async def show_gameover(canvas: FrameBuffer, gameover_frame: Sprite) -> None:
     """Display gameover inscription.
 
     Args:
-        canvas: Main window;
+        canvas: Frame buffer of main window;
         gameover_frame: Frame for inscription.
     """
 
-    # legacy curses feature, returns wrong values
-    rows_number, columns_number = canvas.getmaxyx()
-
-    max_row, max_column = (
-        rows_number - 1,
-        columns_number - 1,
-    )  # the coordinates of the last cell are 1 smaller
+    viewport = canvas.viewport
     frame_rows, frame_columns = get_frame_size(gameover_frame)
 
-    row = (max_row - frame_rows) // 2
-    column = (max_column - frame_columns) // 2
     while True:
+        row = (viewport.max_row - frame_rows) // 2
+        column = (viewport.max_column - frame_columns) // 2
         draw_frame(canvas, row, column, gameover_frame)
         await asyncio.sleep(0)
-        draw_frame(canvas, row, column, gameover_frame, negative=True)
 
 
-async def show_game_description(canvas: curses.window) -> None:
+async def show_game_description(
+    canvas: FrameBuffer,
+    governor: LoadGovernor | None = None,
+) -> None:
     """Display game description.
 
     Args:
-        canvas: Main window.
+        canvas: Frame buffer of main window;
+        governor: Governor choosing description update period.
     """
 
     row = column = 1
+    frame = ''
     while True:
+        previous_frame = frame
         phrase = PHRASES.get(YEAR)
         if phrase:
             frame = f'{YEAR} - {phrase}'
         else:
             frame = str(YEAR)
-        draw_frame(canvas, row, column, frame)
-        await asyncio.sleep(0)
-        draw_frame(canvas, row, column, frame, negative=True)
+        # spaces unpin the rest of the previous longer description
+        canvas.pin(row, column, frame.ljust(len(previous_frame)))
+        await make_delay(governor.hud_period if governor else 1)
 
 
 async def change_year() -> None:
@@ -309,71 +295,684 @@ async def change_year() -> None:
         await make_delay(config.CHANGE_YEAR_DELAY)
 
 
-def draw(canvas: curses.window) -> None:
-    """Draw game.
+async def report_years(output: typing.TextIO) -> None:
+    """Write game load stats at each year boundary.
+
+    Stats are tics per second, peak numbers of entities during the year,
+    shots dropped because the shots pools were full and max resident
+    memory of the process.
 
     Args:
-        canvas: Main window.
+        output: Stream to write stats to.
     """
 
-    canvas.border()
-    canvas.nodelay(True)
-    curses.curs_set(False)
+    year = YEAR
+    peaks = dict.fromkeys(('garbage', 'explosions', 'shots', 'tasks'), 0)
+    tics = 0
+    dropped_shots = PROJECTILES.dropped_shots + BOT_PROJECTILES.dropped_shots
+    start = time.perf_counter()
+    while True:
+        counts = (
+            ENTITIES.count(GARBAGE),
+            ENTITIES.count(EXPLOSION),
+            len(PROJECTILES) + len(BOT_PROJECTILES),
+            len(SCHEDULER),
+        )
+        for name, count in zip(peaks, counts):
+            peaks[name] = max(peaks[name], count)
+        tics += 1
+
+        if YEAR != year:
+            elapsed = time.perf_counter() - start
+            max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            peaks_report = ' '.join(
+                f'{name} {count}' for name, count in peaks.items()
+            )
+            total_dropped_shots = (
+                PROJECTILES.dropped_shots + BOT_PROJECTILES.dropped_shots
+            )
+            output.write(
+                f'{year}: {tics / elapsed:.0f} tics/s, peak {peaks_report}, '
+                f'dropped shots {total_dropped_shots - dropped_shots}, '
+                f'max rss {max_rss // 1024} MiB\n'
+            )
+            output.flush()
+
+            year = YEAR
+            dropped_shots = total_dropped_shots
+            peaks = dict.fromkeys(peaks, 0)
+            tics = 0
+            start = time.perf_counter()
+        await asyncio.sleep(0)
+
+
+def start_game(
+    frame_buffer: FrameBuffer,
+    input_reader: InputReader,
+    coroutines_stats: CoroutinesStats | None = None,
+    show_stats: bool = False,
+    bots_count: int = 0,
+    recording: Recording | None = None,
+    years_report: typing.TextIO | None = None,
+) -> LoadGovernor:
+    """Load frames and spawn game coroutines.
 
-    # legacy curses feature, returns wrong values
-    rows, columns = canvas.getmaxyx()
+    Args:
+        frame_buffer: Frame buffer of main window;
+        input_reader: Queue of pressed keys;
+        coroutines_stats: Stats to collect CPU time of coroutines;
+        show_stats: Flag indicating to display coroutines stats;
+        bots_count: Number of bot ships;
+        recording: Recording to write the session to;
+        years_report: Stream to write game load stats at each year
+            boundary to.
+
+    Returns:
+        Governor of cosmetic detail.
+    """
+
+    frame_buffer.border()
+
+    rows, columns = frame_buffer.getmaxyx()
 
     max_row, max_column = (
         rows - 1,
         columns - 1,
     )  # the coordinates of the last cell are 1 smaller
+    if recording is not None:
+        recording.rows, recording.columns = rows, columns
+        recording.bots_count = bots_count
 
-    frames = get_frames(config.FRAMES_FOLDER_PATH)
-    COROUTINES.extend(
-        [
-            animate_spaceship(
-                canvas,
-                max_row // 2,
-                max_column // 2,
-                frames['rocket'],
-                frames['gameover'][0],
-            ),
-            fill_orbit_with_garbage(
-                canvas,
-                frames['trash'],
-                frames['explosion'],
-            ),
-            show_game_description(canvas),
-            change_year(),
-        ]
+    frames = load_asset_pack()
+    garbage_animations = [
+        ENTITIES.add_animation([frame]) for frame in frames['trash']
+    ]
+    ENTITIES.explosion_animation = ENTITIES.add_animation(
+        get_explosion_animation(frames['explosion'])
     )
-    COROUTINES.extend(
-        [
-            animate_star_blink(
-                canvas,
-                **get_symbol_coordinates(max_row, max_column),
-                symbol=random.choice(config.STAR_SYMBOLS),
-                delay=random.randint(
-                    config.MIN_BLINK_DELAY,
-                    config.MAX_BLINK_DELAY,
-                ),
-            )
-            for _ in range(config.STARS_COUNT)
-        ]
+
+    SCHEDULER.spawn(
+        animate_spaceship(
+            frame_buffer,
+            max_row // 2,
+            max_column // 2,
+            frames['rocket'],
+            frames['gameover'][0],
+            input_reader,
+            recording,
+        )
+    )
+    if bots_count:
+        SCHEDULER.spawn(
+            animate_bots(frame_buffer, bots_count, frames['rocket'])
+        )
+    SCHEDULER.spawn(fill_orbit_with_garbage(frame_buffer, garbage_animations))
+    governor = LoadGovernor(config.TIC_TIMEOUT)
+    SCHEDULER.spawn(show_game_description(frame_buffer, governor))
+    SCHEDULER.spawn(change_year())
+
+    stars_rows, stars_columns, stars_symbols, stars_delays = [], [], [], []
+    for _ in range(config.STARS_COUNT):
+        coordinates = get_symbol_coordinates(max_row, max_column)
+        stars_rows.append(coordinates['row'])
+        stars_columns.append(coordinates['column'])
+        stars_symbols.append(random.choice(config.STAR_SYMBOLS))
+        stars_delays.append(
+            random.randint(config.MIN_BLINK_DELAY, config.MAX_BLINK_DELAY)
+        )
+    star_field = StarField(
+        stars_rows,
+        stars_columns,
+        ''.join(stars_symbols),
+        stars_delays,
     )
+    SCHEDULER.spawn(animate_star_field(frame_buffer, star_field, governor))
+
+    if years_report is not None:
+        SCHEDULER.spawn(report_years(years_report))
+
+    SCHEDULER.coroutines_stats = coroutines_stats
+    if coroutines_stats is not None:
+        coroutines_stats.input_reader = input_reader
+        coroutines_stats.projectiles = {
+            'player': PROJECTILES,
+            'bots': BOT_PROJECTILES,
+        }
+    if coroutines_stats and show_stats:
+        SCHEDULER.spawn(
+            show_coroutines_stats(frame_buffer, coroutines_stats, governor)
+        )
+    return governor
 
-    while True:
-        for coroutine in COROUTINES.copy():
-            try:
-                coroutine.send(None)
-            except StopIteration:
-                COROUTINES.remove(coroutine)
-        canvas.border()  # To fix bug with broken border
-        canvas.refresh()
 
-        time.sleep(config.TIC_TIMEOUT)
+def run_section(
+    name: str,
+    function: typing.Callable[..., typing.Any],
+    *args: typing.Any,
+) -> None:
+    """Call function, timing it in coroutines stats if they're collected.
+
+    Args:
+        name: Section name in coroutines stats;
+        function: Function to call;
+        args: Function arguments.
+    """
+
+    if SCHEDULER.coroutines_stats is None:
+        function(*args)
+    else:
+        SCHEDULER.coroutines_stats.call(name, function, *args)
+
+
+def play_tic(
+    frame_buffer: FrameBuffer,
+    render: bool = True,
+    spectator_server: SpectatorServer | None = None,
+    recording: Recording | None = None,
+) -> None:
+    """Run game coroutines, move entities and present the frame.
+
+    Args:
+        frame_buffer: Frame buffer of main window;
+        render: Flag indicating to send frame to the window;
+        spectator_server: Server to queue frame changes to;
+        recording: Recording to add window resizes to.
+    """
+
+    viewport = frame_buffer.viewport
+    if viewport.update() and recording is not None:
+        recording.record_resize(viewport.rows, viewport.columns)
+    SCHEDULER.run_tic()
+    if render:
+        run_section('entities.draw', ENTITIES.draw, frame_buffer)
+        run_section('projectiles.draw', PROJECTILES.draw, frame_buffer)
+        run_section('bot_projectiles.draw', BOT_PROJECTILES.draw, frame_buffer)
+    size = (viewport.rows, viewport.columns)
+    run_section('entities.update', ENTITIES.update, *size)
+    run_section('projectiles.update', PROJECTILES.update, *size)
+    run_section('bot_projectiles.update', BOT_PROJECTILES.update, *size)
+    if not render:
+        frame_buffer.discard()
+        return
+
+    changes = frame_buffer.present()
+    if spectator_server is not None:
+        spectator_server.publish(changes, viewport.rows, viewport.columns)
+
+
+def count_tic(
+    clock: TicClock,
+    governor: LoadGovernor,
+    recording: Recording | None = None,
+) -> None:
+    """Adjust game to the finished tic.
+
+    Args:
+        clock: Game clock;
+        governor: Governor of cosmetic detail;
+        recording: Recording to write number of tics to.
+    """
+
+    if clock.throttle:
+        # unthrottled game keeps full detail to stay reproducible
+        governor.update(clock.last_work_time)
+        ENTITIES.explosion_frames_step = governor.explosion_frames_step
+    if recording is not None:
+        recording.tics = clock.tics
+
+
+def draw(
+    canvas: curses.window | HeadlessCanvas,
+    coroutines_stats: CoroutinesStats | None = None,
+    show_stats: bool = False,
+    bots_count: int = 0,
+    recording: Recording | None = None,
+    throttle: bool = True,
+    max_tics: int | None = None,
+    render: bool = True,
+    years_report: typing.TextIO | None = None,
+    spectator_server: SpectatorServer | None = None,
+    window_sizes: dict[int, tuple[int, int]] | None = None,
+) -> TicClock:
+    """Draw game.
+
+    Args:
+        canvas: Main window or its in-memory replacement;
+        coroutines_stats: Stats to collect CPU time of coroutines;
+        show_stats: Flag indicating to display coroutines stats;
+        bots_count: Number of bot ships;
+        recording: Recording to write the session to;
+        throttle: Flag indicating to keep tic period, otherwise tics
+            run as fast as possible;
+        max_tics: Number of tics to stop the game after;
+        render: Flag indicating to send frames to the window;
+        years_report: Stream to write game load stats at each year
+            boundary to;
+        spectator_server: Server to broadcast frame changes with;
+        window_sizes: Sizes to resize in-memory window to by the number
+            of tics played before resize, e.g. of a replayed session.
+
+    Returns:
+        Clock of the finished game with tics work stats.
+    """
+
+    canvas.nodelay(True)
+
+    viewport = Viewport(canvas)
+    frame_buffer = FrameBuffer(canvas, viewport)
+    # in-memory window has no stdin, its keys are scripted
+    stdin_fileno = None
+    if not isinstance(canvas, HeadlessCanvas):
+        stdin_fileno = sys.stdin.fileno()
+    input_reader = InputReader(canvas, stdin_fileno)
+
+    governor = start_game(
+        frame_buffer,
+        input_reader,
+        coroutines_stats,
+        show_stats,
+        bots_count,
+        recording,
+        years_report,
+    )
+
+    clock = TicClock(
+        config.TIC_TIMEOUT,
+        config.MAX_CATCH_UP_TICS,
+        throttle,
+        input_reader.wait,
+    )
+    if coroutines_stats is not None:
+        coroutines_stats.tic_clock = clock
+        coroutines_stats.spectator_server = spectator_server
+    while max_tics is None or clock.tics < max_tics:
+        if window_sizes and clock.tics in window_sizes:
+            canvas.resize(*window_sizes[clock.tics])
+        play_tic(frame_buffer, render, spectator_server, recording)
+        if spectator_server is not None:
+            spectator_server.send()
+        clock.wait()
+        count_tic(clock, governor, recording)
+
+    input_reader.close()
+    return clock
+
+
+async def draw_async(
+    canvas: curses.window | HeadlessCanvas,
+    coroutines_stats: CoroutinesStats | None = None,
+    show_stats: bool = False,
+    bots_count: int = 0,
+    recording: Recording | None = None,
+    throttle: bool = True,
+    max_tics: int | None = None,
+    spectator_server: SpectatorServer | None = None,
+) -> TicClock:
+    """Draw game on asyncio event loop.
+
+    Game coroutines are still resumed by the tic scheduler, while
+    the time between tics is given to the event loop. So the process
+    idles between tics, keys are queued by the loop as soon as stdin
+    gets them and other asyncio tasks can run next to the game. Tasks
+    waiting for the tic barrier, e.g. spectator server, run after each
+    tic is presented.
+
+    Args:
+        canvas: Main window or its in-memory replacement;
+        coroutines_stats: Stats to collect CPU time of coroutines;
+        show_stats: Flag indicating to display coroutines stats;
+        bots_count: Number of bot ships;
+        recording: Recording to write the session to;
+        throttle: Flag indicating to keep tic period, otherwise tics
+            run as fast as possible;
+        max_tics: Number of tics to stop the game after;
+        spectator_server: Server to broadcast frame changes with.
+
+    Returns:
+        Clock of the finished game with tics work stats.
+    """
+
+    canvas.nodelay(True)
+
+    viewport = Viewport(canvas)
+    frame_buffer = FrameBuffer(canvas, viewport)
+    input_reader = InputReader(canvas)
+    loop = asyncio.get_running_loop()
+    # in-memory window has no stdin, its keys are scripted
+    stdin_fileno = None
+    if not isinstance(canvas, HeadlessCanvas):
+        stdin_fileno = sys.stdin.fileno()
+        loop.add_reader(stdin_fileno, input_reader.poll)
+
+    governor = start_game(
+        frame_buffer,
+        input_reader,
+        coroutines_stats,
+        show_stats,
+        bots_count,
+        recording,
+    )
+
+    tic_barrier = TicBarrier()
+    tasks = []
+    if spectator_server is not None:
+        tasks.append(
+            loop.create_task(serve_spectators(spectator_server, tic_barrier))
+        )
+
+    clock = TicClock(config.TIC_TIMEOUT, config.MAX_CATCH_UP_TICS, throttle)
+    if coroutines_stats is not None:
+        coroutines_stats.tic_clock = clock
+        coroutines_stats.spectator_server = spectator_server
+    try:
+        while max_tics is None or clock.tics < max_tics:
+            play_tic(frame_buffer, True, spectator_server, recording)
+            tic_barrier.release(clock.tics + 1)
+            await clock.wait_async()
+            count_tic(clock, governor, recording)
+    finally:
+        for task in tasks:
+            task.cancel()
+        if stdin_fileno is not None:
+            loop.remove_reader(stdin_fileno)
+    return clock
+
+
+def draw_in_terminal(
+    canvas: curses.window | AnsiTerminal,
+    use_asyncio: bool,
+    *args: typing.Any,
+    **kwargs: typing.Any,
+) -> None:
+    """Set up terminal and draw game.
+
+    Args:
+        canvas: Main window or raw terminal;
+        use_asyncio: Flag indicating to run game on asyncio event loop;
+        args: Other arguments of draw;
+        kwargs: Other keyword arguments of draw.
+    """
+
+    if isinstance(canvas, curses.window):
+        curses.curs_set(False)
+    if use_asyncio:
+        asyncio.run(draw_async(canvas, *args, **kwargs))
+    else:
+        draw(canvas, *args, **kwargs)
+
+
+def simulate(
+    frame_ring: FrameRing,
+    keys_connection: Connection,
+    use_asyncio: bool,
+    *args: typing.Any,
+    **kwargs: typing.Any,
+) -> None:
+    """Draw game in simulation process of split render mode.
+
+    Args:
+        frame_ring: Ring to publish frames to;
+        keys_connection: Pipe end to receive codes of pressed keys;
+        use_asyncio: Flag indicating to run game on asyncio event loop;
+        args: Other arguments of draw;
+        kwargs: Other keyword arguments of draw.
+    """
+
+    # bell of the forked raw terminal is never sent from this process
+    set_bell()
+    canvas = SharedFrameCanvas(frame_ring, keys_connection)
+    try:
+        if use_asyncio:
+            asyncio.run(draw_async(canvas, *args, **kwargs))
+        else:
+            draw(canvas, *args, **kwargs)
+    except KeyboardInterrupt:
+        pass
+
+
+def draw_in_processes(
+    canvas: curses.window | AnsiTerminal,
+    use_asyncio: bool,
+    *args: typing.Any,
+    **kwargs: typing.Any,
+) -> None:
+    """Draw game with simulation and rendering in separate processes.
+
+    Simulation process runs the game on in-memory window and
+    publishes each frame to shared memory, while this process draws
+    the newest frame in the terminal and passes pressed keys back.
+    So slow terminal output doesn't slow down the game.
+
+    Args:
+        canvas: Main window or raw terminal;
+        use_asyncio: Flag indicating to run game on asyncio event loop;
+        args: Other arguments of draw;
+        kwargs: Other keyword arguments of draw.
+    """
+
+    if isinstance(canvas, curses.window):
+        curses.curs_set(False)
+    frame_ring = FrameRing(*config.MAX_SHARED_FRAME_SIZE)
+    frame_ring.set_size(*canvas.getmaxyx())
+    keys_receiver, keys_sender = multiprocessing.Pipe(duplex=False)
+    simulation = multiprocessing.Process(
+        target=simulate,
+        args=(frame_ring, keys_receiver, use_asyncio, *args),
+        kwargs=kwargs,
+        daemon=True,
+    )
+    simulation.start()
+    try:
+        render_frames(
+            canvas,
+            frame_ring,
+            keys_sender,
+            simulation.is_alive,
+            config.TIC_TIMEOUT / 10,
+        )
+    finally:
+        simulation.terminate()
+        simulation.join()
+        frame_ring.close()
+        frame_ring.unlink()
+
+
+def replay(
+    recording: Recording,
+    coroutines_stats: CoroutinesStats | None = None,
+) -> None:
+    """Replay recorded session without terminal as fast as possible.
+
+    Prints tics work stats, so a recorded session works as
+    a repeatable performance test.
+
+    Args:
+        recording: Recorded session;
+        coroutines_stats: Stats to collect CPU time of coroutines.
+    """
+
+    random.seed(recording.seed)
+    canvas = HeadlessCanvas(
+        recording.rows, recording.columns, recording.get_keys()
+    )
+
+    start = time.perf_counter()
+    clock = draw(
+        canvas,
+        coroutines_stats,
+        bots_count=recording.bots_count,
+        throttle=False,
+        max_tics=recording.tics,
+        window_sizes=recording.get_window_sizes(),
+    )
+    elapsed = time.perf_counter() - start
+
+    print(f'tics: {clock.tics}')
+    print(f'time: {elapsed:.2f} s, {clock.tics / elapsed:.0f} tics/s')
+    print(
+        f'tic work: {clock.average_work_time * 1e3:.2f} ms average, '
+        f'{clock.max_work_time * 1e3:.2f} ms max'
+    )
+
+
+def fast_forward(
+    years: int,
+    rows: int,
+    columns: int,
+    bots_count: int = 0,
+    render: bool = True,
+) -> None:
+    """Simulate game years without terminal as fast as possible.
+
+    Prints game load stats at each year boundary, e.g. to soak test
+    late years of the game.
+
+    Args:
+        years: Number of game years to simulate;
+        rows: Number of window rows;
+        columns: Number of window columns;
+        bots_count: Number of bot ships;
+        render: Flag indicating to render frames to in-memory window.
+    """
+
+    draw(
+        HeadlessCanvas(rows, columns),
+        bots_count=bots_count,
+        throttle=False,
+        max_tics=years * config.CHANGE_YEAR_DELAY,
+        render=render,
+        years_report=sys.stdout,
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Space game.')
+    parser.add_argument(
+        '--stats',
+        choices=['overlay', 'dump'],
+        help='collect CPU time of coroutines, display it in the game '
+        'or print it on exit',
+    )
+    parser.add_argument(
+        '--bots',
+        type=int,
+        default=0,
+        help='number of bot ships hunting garbage, e.g. for load testing',
+    )
+    parser.add_argument(
+        '--asyncio',
+        action='store_true',
+        help='run game on asyncio event loop',
+    )
+    parser.add_argument(
+        '--split-render',
+        action='store_true',
+        help='run game and terminal rendering in separate processes',
+    )
+    parser.add_argument(
+        '--ansi',
+        action='store_true',
+        help='write to terminal with raw escape sequences instead of curses, '
+        'one write per tic',
+    )
+    recording_group = parser.add_mutually_exclusive_group()
+    recording_group.add_argument(
+        '--record',
+        metavar='PATH',
+        help='write seed and controls of the session to the file',
+    )
+    recording_group.add_argument(
+        '--replay',
+        metavar='PATH',
+        help='replay recorded session without terminal and print its stats',
+    )
+    recording_group.add_argument(
+        '--fast-forward',
+        metavar='YEARS',
+        type=int,
+        help='simulate game years without terminal and sleep, print load '
+        'stats of each year',
+    )
+    parser.add_argument(
+        '--size',
+        metavar=('ROWS', 'COLUMNS'),
+        type=int,
+        nargs=2,
+        default=(40, 160),
+        help='window size in fast forward mode',
+    )
+    parser.add_argument(
+        '--no-render',
+        action='store_false',
+        dest='render',
+        help='skip rendering in fast forward mode',
+    )
+    parser.add_argument(
+        '--serve',
+        metavar='ADDRESS',
+        help='broadcast the game to spectators on `host:port` or Unix '
+        'socket path, watch it with `python spectators.py ADDRESS`',
+    )
+    args = parser.parse_args()
+    # session and stats stay in the simulation process
+    if args.split_render and (args.record or args.stats == 'dump'):
+        parser.error(
+            '--split-render is not allowed with --record and --stats dump'
+        )
+    return args
 
 
 if __name__ == '__main__':
+    args = parse_args()
+    coroutines_stats = CoroutinesStats() if args.stats else None
+
+    if args.replay:
+        replay(Recording.load(args.replay), coroutines_stats)
+        if args.stats:
+            print('\n'.join(coroutines_stats.get_report_lines()))
+        sys.exit()
+
+    if args.fast_forward:
+        fast_forward(args.fast_forward, *args.size, args.bots, args.render)
+        sys.exit()
+
+    recording = None
+    if args.record:
+        recording = Recording(seed=random.randrange(2**32))
+        random.seed(recording.seed)
+
+    spectator_server = None
+    if args.serve:
+        spectator_server = SpectatorServer(args.serve)
+
+    draw_function = draw_in_terminal
+    if args.split_render:
+        draw_function = draw_in_processes
+    draw_args = (
+        args.asyncio,
+        coroutines_stats,
+        args.stats == 'overlay',
+        args.bots,
+        recording,
+    )
+
     curses.update_lines_cols()
-    curses.wrapper(draw)
+    try:
+        if args.ansi:
+            with AnsiTerminal() as terminal:
+                draw_function(
+                    terminal, *draw_args, spectator_server=spectator_server
+                )
+        else:
+            curses.wrapper(
+                draw_function, *draw_args, spectator_server=spectator_server
+            )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if spectator_server is not None:
+            spectator_server.close()
+        if recording is not None:
+            recording.save(args.record)
+        if args.stats == 'dump':
+            print('\n'.join(coroutines_stats.get_report_lines()))
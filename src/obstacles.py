@@ -1,8 +1,11 @@
 import asyncio
-import curses
+import bisect
+import math
 import typing
+from array import array
 
 from curses_tools import draw_frame
+from frame_buffer import FrameBuffer
 
 
 class Obstacle:
@@ -19,6 +22,7 @@ class Obstacle:
         self.rows_size = rows_size
         self.columns_size = columns_size
         self.uid = uid
+        self.is_hit = False
 
     def get_bounding_box_frame(self) -> str:
         """Get frame of bounding box
@@ -58,14 +62,209 @@ class Obstacle:
             obj_size_columns: Obj height.
         """
 
-        return has_collision(
-            (self.row, self.column),
-            (self.rows_size, self.columns_size),
-            (obj_corner_row, obj_corner_column),
-            (obj_size_rows, obj_size_columns),
+        return is_overlapping(
+            self.row,
+            self.column,
+            self.rows_size,
+            self.columns_size,
+            obj_corner_row,
+            obj_corner_column,
+            obj_size_rows,
+            obj_size_columns,
         )
 
 
+class ObstaclesGrid:
+    """Uniform grid index of obstacles for broadphase collision queries.
+
+    Every obstacle is registered in each grid cell its bounding box
+    overlaps, so a query only has to check obstacles from the cells
+    the queried object overlaps instead of all obstacles on the screen.
+    """
+
+    def __init__(self, cell_size: int = 8) -> None:
+        self.cell_size = cell_size
+        # dicts are used instead of sets to keep insertion order stable
+        self._cells: dict[tuple[int, int], dict[Obstacle, None]] = {}
+        self._obstacles_cells: dict[Obstacle, tuple[int, int, int, int]] = {}
+
+    def __iter__(self) -> typing.Iterator[Obstacle]:
+        return iter(list(self._obstacles_cells))
+
+    def __len__(self) -> int:
+        return len(self._obstacles_cells)
+
+    def __contains__(self, obstacle: Obstacle) -> bool:
+        return obstacle in self._obstacles_cells
+
+    def _get_cells_range(
+        self,
+        row: float,
+        column: float,
+        rows_size: int,
+        columns_size: int,
+    ) -> tuple[int, int, int, int]:
+        """Get range of grid cells overlapped by a rectangle.
+
+        Args:
+            row: Left upper rectangle row position;
+            column: Left upper rectangle column position;
+            rows_size: Rectangle width;
+            columns_size: Rectangle height.
+
+        Returns:
+            First row cell, last row cell, first column cell
+            and last column cell.
+        """
+
+        cell_size = self.cell_size
+        return (
+            math.floor(row) // cell_size,
+            math.floor(row + rows_size) // cell_size,
+            math.floor(column) // cell_size,
+            math.floor(column + columns_size) // cell_size,
+        )
+
+    def _link(
+        self,
+        obstacle: Obstacle,
+        cells_range: tuple[int, int, int, int],
+    ) -> None:
+        first_row, last_row, first_column, last_column = cells_range
+        for cell_row in range(first_row, last_row + 1):
+            for cell_column in range(first_column, last_column + 1):
+                cell = self._cells.setdefault((cell_row, cell_column), {})
+                cell[obstacle] = None
+
+    def _unlink(
+        self,
+        obstacle: Obstacle,
+        cells_range: tuple[int, int, int, int],
+    ) -> None:
+        first_row, last_row, first_column, last_column = cells_range
+        for cell_row in range(first_row, last_row + 1):
+            for cell_column in range(first_column, last_column + 1):
+                cell = self._cells[(cell_row, cell_column)]
+                del cell[obstacle]
+                if not cell:
+                    del self._cells[(cell_row, cell_column)]
+
+    def add(self, obstacle: Obstacle) -> None:
+        """Register obstacle in the grid.
+
+        Args:
+            obstacle: Obstacle to register.
+        """
+
+        cells_range = self._get_cells_range(
+            obstacle.row,
+            obstacle.column,
+            obstacle.rows_size,
+            obstacle.columns_size,
+        )
+        self._obstacles_cells[obstacle] = cells_range
+        self._link(obstacle, cells_range)
+
+    def remove(self, obstacle: Obstacle) -> None:
+        """Remove obstacle from the grid.
+
+        Args:
+            obstacle: Registered obstacle.
+        """
+
+        cells_range = self._obstacles_cells.pop(obstacle)
+        self._unlink(obstacle, cells_range)
+
+    def update(self, obstacle: Obstacle) -> None:
+        """Move obstacle to grid cells matching its current position.
+
+        Args:
+            obstacle: Registered obstacle with changed position.
+        """
+
+        cells_range = self._get_cells_range(
+            obstacle.row,
+            obstacle.column,
+            obstacle.rows_size,
+            obstacle.columns_size,
+        )
+        previous_cells_range = self._obstacles_cells[obstacle]
+        if cells_range == previous_cells_range:
+            return
+
+        self._unlink(obstacle, previous_cells_range)
+        self._obstacles_cells[obstacle] = cells_range
+        self._link(obstacle, cells_range)
+
+    def get_candidates(
+        self,
+        row: float,
+        column: float,
+        rows_size: int = 1,
+        columns_size: int = 1,
+    ) -> list[Obstacle]:
+        """Get obstacles from grid cells overlapped by a rectangle.
+
+        Args:
+            row: Left upper rectangle row position;
+            column: Left upper rectangle column position;
+            rows_size: Rectangle width;
+            columns_size: Rectangle height.
+
+        Returns:
+            Obstacles which may collide with the rectangle.
+        """
+
+        first_row, last_row, first_column, last_column = self._get_cells_range(
+            row, column, rows_size, columns_size
+        )
+        if first_row == last_row and first_column == last_column:
+            return list(self._cells.get((first_row, first_column), ()))
+
+        candidates = {}
+        for cell_row in range(first_row, last_row + 1):
+            for cell_column in range(first_column, last_column + 1):
+                cell = self._cells.get((cell_row, cell_column))
+                if cell:
+                    candidates.update(cell)
+        return list(candidates)
+
+    def get_collisions(
+        self,
+        row: float,
+        column: float,
+        rows_size: int = 1,
+        columns_size: int = 1,
+    ) -> list[Obstacle]:
+        """Get obstacles colliding with a rectangle.
+
+        Args:
+            row: Left upper rectangle row position;
+            column: Left upper rectangle column position;
+            rows_size: Rectangle width;
+            columns_size: Rectangle height.
+
+        Returns:
+            Colliding obstacles.
+        """
+
+        candidates = self.get_candidates(row, column, rows_size, columns_size)
+        return [
+            obstacle
+            for obstacle in candidates
+            if is_overlapping(
+                obstacle.row,
+                obstacle.column,
+                obstacle.rows_size,
+                obstacle.columns_size,
+                row,
+                column,
+                rows_size,
+                columns_size,
+            )
+        ]
+
+
 def _get_bounding_box_lines(
     rows: int,
     columns: int,
@@ -84,14 +283,14 @@ def _get_bounding_box_lines(
 
 
 async def show_obstacles(
-    canvas: curses.window,
-    obstacles: list[Obstacle],
+    canvas: FrameBuffer,
+    obstacles: typing.Iterable[Obstacle],
 ) -> None:
     """Display bounding boxes of every obstacle in a list.
 
     Args:
-        canvas: Main window;
-        obstacles: List of obstacles.
+        canvas: Frame buffer of main window;
+        obstacles: Collection of obstacles.
     """
 
     while True:
@@ -102,35 +301,223 @@ async def show_obstacles(
 
         await asyncio.sleep(0)
 
-        for row, column, frame in boxes:
-            draw_frame(canvas, row, column, frame, negative=True)
 
+class Boxes:
+    """Rectangles kept as parallel arrays for batch collision queries.
+
+    Args:
+        rows: Left upper rows of rectangles;
+        columns: Left upper columns of rectangles;
+        rows_sizes: Rectangles widths;
+        columns_sizes: Rectangles heights.
+    """
 
-def _is_point_inside(
-    corner_row: int,
-    corner_column: int,
-    size_rows: int,
-    size_columns: int,
-    point_row: int,
-    point_row_column: int,
+    def __init__(
+        self,
+        rows: typing.Iterable[float] = (),
+        columns: typing.Iterable[float] = (),
+        rows_sizes: typing.Iterable[int] = (),
+        columns_sizes: typing.Iterable[int] = (),
+    ) -> None:
+        self.rows = array('d', rows)
+        self.columns = array('d', columns)
+        self.rows_sizes = array('H', rows_sizes)
+        self.columns_sizes = array('H', columns_sizes)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def append(
+        self,
+        row: float,
+        column: float,
+        rows_size: int = 1,
+        columns_size: int = 1,
+    ) -> None:
+        """Add rectangle.
+
+        Args:
+            row: Left upper rectangle row;
+            column: Left upper rectangle column;
+            rows_size: Rectangle width;
+            columns_size: Rectangle height.
+        """
+
+        self.rows.append(row)
+        self.columns.append(column)
+        self.rows_sizes.append(rows_size)
+        self.columns_sizes.append(columns_size)
+
+
+def is_overlapping(
+    box_row: float,
+    box_column: float,
+    box_rows_size: int,
+    box_columns_size: int,
+    row: float,
+    column: float,
+    rows_size: int = 1,
+    columns_size: int = 1,
 ) -> bool:
-    """Check if a point is inside a rectangle of a given size.
+    """Determine if two rectangles overlap.
+
+    Args:
+        box_row: Left upper row of the first rectangle;
+        box_column: Left upper column of the first rectangle;
+        box_rows_size: First rectangle width;
+        box_columns_size: First rectangle height;
+        row: Left upper row of the second rectangle;
+        column: Left upper column of the second rectangle;
+        rows_size: Second rectangle width;
+        columns_size: Second rectangle height.
+    """
+
+    if not row - box_rows_size < box_row < row + rows_size:
+        return False
+    return column - box_columns_size < box_column < column + columns_size
+
+
+def find_hits(
+    boxes: Boxes,
+    row: float,
+    column: float,
+    rows_size: int = 1,
+    columns_size: int = 1,
+) -> list[int]:
+    """Find rectangles overlapping the given one.
+
+    Args:
+        boxes: Rectangles to check, e.g. obstacles;
+        row: Left upper row of the rectangle;
+        column: Left upper column of the rectangle;
+        rows_size: Rectangle width;
+        columns_size: Rectangle height.
+
+    Returns:
+        Indices of overlapping rectangles.
+    """
+
+    return [
+        index
+        for index, box in enumerate(
+            zip(
+                boxes.rows,
+                boxes.columns,
+                boxes.rows_sizes,
+                boxes.columns_sizes,
+            )
+        )
+        if is_overlapping(*box, row, column, rows_size, columns_size)
+    ]
+
+
+def find_collisions(
+    obstacles_boxes: Boxes,
+    objects_boxes: Boxes,
+) -> list[tuple[int, int]]:
+    """Find all overlapping pairs of obstacles and objects.
+
+    Obstacles are sorted by row once, so each object is checked only
+    against obstacles whose rows may overlap it.
 
     Args:
+        obstacles_boxes: Rectangles of obstacles;
+        objects_boxes: Rectangles of objects, e.g. shots.
+
+    Returns:
+        Pairs of object index and obstacle index.
+    """
+
+    if not obstacles_boxes or not objects_boxes:
+        return []
+
+    obstacles_rows, obstacles_columns = (
+        obstacles_boxes.rows,
+        obstacles_boxes.columns,
+    )
+    obstacles_rows_sizes, obstacles_columns_sizes = (
+        obstacles_boxes.rows_sizes,
+        obstacles_boxes.columns_sizes,
+    )
+    order = sorted(range(len(obstacles_rows)), key=obstacles_rows.__getitem__)
+    sorted_rows = [obstacles_rows[index] for index in order]
+    max_rows_size = max(obstacles_rows_sizes)
+
+    collisions = []
+    for object_index, (row, column, rows_size, columns_size) in enumerate(
+        zip(
+            objects_boxes.rows,
+            objects_boxes.columns,
+            objects_boxes.rows_sizes,
+            objects_boxes.columns_sizes,
+        )
+    ):
+        last_row, last_column = row + rows_size, column + columns_size
+        start = bisect.bisect_right(sorted_rows, row - max_rows_size)
+        end = bisect.bisect_left(sorted_rows, last_row)
+        for obstacle_index in order[start:end]:
+            # obstacle row is less than last_row because of bisect
+            min_row = row - obstacles_rows_sizes[obstacle_index]
+            min_column = column - obstacles_columns_sizes[obstacle_index]
+            obstacle_column = obstacles_columns[obstacle_index]
+            is_rows_overlapping = min_row < obstacles_rows[obstacle_index]
+            is_columns_overlapping = min_column < obstacle_column < last_column
+            if is_rows_overlapping and is_columns_overlapping:
+                collisions.append((object_index, obstacle_index))
+    return collisions
+
+
+def get_segment_entry(
+    start_row: float,
+    start_column: float,
+    rows_delta: float,
+    columns_delta: float,
+    corner_row: float,
+    corner_column: float,
+    rows_size: float,
+    columns_size: float,
+) -> float | None:
+    """Find when a moving point enters a rectangle.
+
+    Args:
+        start_row: Row of segment start;
+        start_column: Column of segment start;
+        rows_delta: Vertical movement along segment;
+        columns_delta: Horizontal movement along segment;
         corner_row: Left upper rectangle row position;
-        corner_column: Left upper rectangle column position
-        size_rows: Rectangle width;
-        size_columns: Rectangle height;
-        point_row: Left upper point row position;
-        point_row_column: Left upper point column position;
+        corner_column: Left upper rectangle column position;
+        rows_size: Rectangle width;
+        columns_size: Rectangle height.
+
+    Returns:
+        Segment fraction from 0 to 1 where point enters the rectangle,
+        None if segment doesn't cross the rectangle.
     """
 
-    rows_flag = corner_row <= point_row < corner_row + size_rows
-    columns_flag = (
-        corner_column <= point_row_column < corner_column + size_columns
+    entry, exit_ = 0.0, 1.0
+    axes = (
+        (start_row, rows_delta, corner_row, corner_row + rows_size),
+        (
+            start_column,
+            columns_delta,
+            corner_column,
+            corner_column + columns_size,
+        ),
     )
+    for start, delta, low, high in axes:
+        if not delta:
+            if not low < start < high:
+                return None
+            continue
 
-    return rows_flag and columns_flag
+        low_time, high_time = (low - start) / delta, (high - start) / delta
+        if low_time > high_time:
+            low_time, high_time = high_time, low_time
+
+        entry, exit_ = max(entry, low_time), min(exit_, high_time)
+        if entry >= exit_:
+            return None
+    return entry
 
 
 def has_collision(
@@ -148,37 +535,6 @@ def has_collision(
         obj_size: Obj size (width, height).
     """
 
-    opposite_obstacle_corner = (
-        obstacle_corner[0] + obstacle_size[0] - 1,
-        obstacle_corner[1] + obstacle_size[1] - 1,
-    )
-
-    opposite_obj_corner = (
-        obj_corner[0] + obj_size[0] - 1,
-        obj_corner[1] + obj_size[1] - 1,
-    )
-
-    return any(
-        [
-            _is_point_inside(
-                *obstacle_corner,
-                *obstacle_size,
-                *obj_corner,
-            ),
-            _is_point_inside(
-                *obstacle_corner,
-                *obstacle_size,
-                *opposite_obj_corner,
-            ),
-            _is_point_inside(
-                *obj_corner,
-                *obj_size,
-                *obstacle_corner,
-            ),
-            _is_point_inside(
-                *obj_corner,
-                *obj_size,
-                *opposite_obstacle_corner,
-            ),
-        ]
+    return is_overlapping(
+        *obstacle_corner, *obstacle_size, *obj_corner, *obj_size
     )
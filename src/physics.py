@@ -1,4 +1,5 @@
 import math
+from array import array
 
 
 def _limit(
@@ -61,6 +62,31 @@ def _apply_acceleration(
     return result_speed
 
 
+def _update_axis_speed(
+    speed: float,
+    direction: int,
+    speed_limit: int,
+    fading: float,
+) -> int | float:
+    """Fade speed along one axis and accelerate it in force direction.
+
+    Args:
+        speed: Current speed along the axis;
+        direction: Force direction along the axis: -1, 0 or 1;
+        speed_limit: Speed limit along the axis;
+        fading: Speed attenuation coefficient.
+
+    Returns:
+        Final speed.
+    """
+
+    # extinguish the speed so that the ship stops over time
+    speed *= fading
+    if direction:
+        speed = _apply_acceleration(speed, speed_limit, direction > 0)
+    return speed
+
+
 def update_speed(
     row_speed: int,
     column_speed: int,
@@ -112,23 +138,57 @@ def update_speed(
             'Expects float between 0 and 1.'
         )
 
-    # extinguish the speed so that the ship stops over time
-    row_speed *= fading
-    column_speed *= fading
-
-    row_speed_limit, column_speed_limit = (
-        abs(row_speed_limit),
-        abs(column_speed_limit),
+    row_speed = _update_axis_speed(
+        row_speed, rows_direction, row_speed_limit, fading
+    )
+    column_speed = _update_axis_speed(
+        column_speed, columns_direction, column_speed_limit, fading
     )
 
-    if rows_direction != 0:
-        row_speed = _apply_acceleration(
-            row_speed, row_speed_limit, rows_direction > 0
-        )
+    return row_speed, column_speed
+
 
-    if columns_direction != 0:
-        column_speed = _apply_acceleration(
-            column_speed, column_speed_limit, columns_direction > 0
+def update_speeds(
+    rows_speeds: array,
+    columns_speeds: array,
+    rows_directions: array,
+    columns_directions: array,
+    row_speed_limit: int = 2,
+    column_speed_limit: int = 2,
+    fading: float = 0.8,
+) -> None:
+    """Update speeds of many ships at once, same as `update_speed` does.
+
+    Arguments are checked once per call instead of once per ship,
+    speeds are updated in place.
+
+    Args:
+        rows_speeds: Current row speeds;
+        columns_speeds: Current column speeds;
+        rows_directions: Horizontal directions of movement;
+        columns_directions: Vertical directions of movement;
+        row_speed_limit: Horizontal speed limit;
+        column_speed_limit: Vertical speed limit;
+        fading: Speed attenuation coefficient.
+    """
+
+    for directions, name in (
+        (rows_directions, 'rows_directions'),
+        (columns_directions, 'columns_directions'),
+    ):
+        if not set(directions) <= {-1, 0, 1}:
+            raise ValueError(f'Wrong {name} values. Expects -1, 0 or 1.')
+
+    if fading < 0 or fading > 1:
+        raise ValueError(
+            f'Wrong fading value {fading}. Expects float between 0 and 1.'
         )
 
-    return row_speed, column_speed
+    for speeds, directions, speed_limit in (
+        (rows_speeds, rows_directions, row_speed_limit),
+        (columns_speeds, columns_directions, column_speed_limit),
+    ):
+        for index, direction in enumerate(directions):
+            speeds[index] = _update_axis_speed(
+                speeds[index], direction, speed_limit, fading
+            )
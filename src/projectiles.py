@@ -0,0 +1,196 @@
+from array import array
+
+from curses_tools import draw_frame
+from curses_tools import Sprite
+from frame_buffer import FrameBuffer
+from obstacles import get_segment_entry
+from obstacles import Obstacle
+from obstacles import ObstaclesGrid
+
+# shot flashes in place for a tic per sprite, then flies
+FLASH_SPRITES = (Sprite('*'), Sprite('O'))
+VERTICAL_SHOT_SPRITE = Sprite('|')
+HORIZONTAL_SHOT_SPRITE = Sprite('-')
+
+
+class Projectiles:
+    """Fixed capacity pool of spaceship shots.
+
+    Shot slots are allocated once, a fired shot takes a free slot and
+    a removed shot returns it, so firing never allocates. Each `update`
+    advances all shots and tests the segment passed by a shot during
+    the tic against obstacles, so a fast shot can't fly through
+    garbage between two tics.
+
+    Args:
+        obstacles: Grid of obstacles which shots hit;
+        capacity: Max number of shots in flight.
+    """
+
+    def __init__(self, obstacles: ObstaclesGrid, capacity: int) -> None:
+        self.obstacles = obstacles
+        self.capacity = capacity
+        self.dropped_shots = 0
+
+        self.rows = array('d', bytes(8 * capacity))
+        self.columns = array('d', bytes(8 * capacity))
+        self.rows_speed = array('d', bytes(8 * capacity))
+        self.columns_speed = array('d', bytes(8 * capacity))
+        self.ages = array('L', [0] * capacity)
+        self.is_active = array('B', bytes(capacity))
+
+        # free slots stack, lower slots are taken first
+        self._free_slots = array('H', reversed(range(capacity)))
+
+    def __len__(self) -> int:
+        return self.capacity - len(self._free_slots)
+
+    def fire(
+        self,
+        row: float,
+        column: float,
+        rows_speed: float,
+        columns_speed: float = 0,
+    ) -> bool:
+        """Launch shot, it flashes in place before flying.
+
+        Args:
+            row: Start row position;
+            column: Start column position;
+            rows_speed: Vertical speed;
+            columns_speed: Horizontal speed.
+
+        Returns:
+            False if all slots are taken and shot is dropped.
+        """
+
+        if not self._free_slots:
+            self.dropped_shots += 1
+            return False
+
+        slot = self._free_slots.pop()
+        self.rows[slot], self.columns[slot] = row, column
+        self.rows_speed[slot] = rows_speed
+        self.columns_speed[slot] = columns_speed
+        self.ages[slot] = 0
+        self.is_active[slot] = True
+        return True
+
+    def _release(self, slot: int) -> None:
+        self.is_active[slot] = False
+        self._free_slots.append(slot)
+
+    def draw(self, canvas: FrameBuffer) -> None:
+        """Draw all shots.
+
+        Args:
+            canvas: Frame buffer of main window.
+        """
+
+        flash_tics = len(FLASH_SPRITES)
+        rows, columns, ages = self.rows, self.columns, self.ages
+        columns_speed = self.columns_speed
+        for slot, is_active in enumerate(self.is_active):
+            if not is_active:
+                continue
+
+            age = ages[slot]
+            if age < flash_tics:
+                sprite = FLASH_SPRITES[age]
+            elif columns_speed[slot]:
+                sprite = HORIZONTAL_SHOT_SPRITE
+            else:
+                sprite = VERTICAL_SHOT_SPRITE
+            draw_frame(canvas, rows[slot], columns[slot], sprite)
+
+    def _find_hit(
+        self,
+        row: float,
+        column: float,
+        rows_delta: float,
+        columns_delta: float,
+    ) -> Obstacle | None:
+        """Find the first obstacle on the shot way.
+
+        Shot is a single cell, so it hits an obstacle when its left
+        upper corner enters the obstacle extended by one cell up
+        and left.
+
+        Args:
+            row: Shot row position before move;
+            column: Shot column position before move;
+            rows_delta: Vertical move;
+            columns_delta: Horizontal move.
+
+        Returns:
+            Hit obstacle or None.
+        """
+
+        # candidates from the box covering the whole way of the shot
+        candidates = self.obstacles.get_candidates(
+            min(row, row + rows_delta),
+            min(column, column + columns_delta),
+            abs(rows_delta) + 1,
+            abs(columns_delta) + 1,
+        )
+
+        hit, hit_time = None, None
+        for obstacle in candidates:
+            if obstacle.is_hit:
+                continue  # obstacle is already destroyed by other shot
+
+            entry_time = get_segment_entry(
+                row,
+                column,
+                rows_delta,
+                columns_delta,
+                obstacle.row - 1,
+                obstacle.column - 1,
+                obstacle.rows_size + 1,
+                obstacle.columns_size + 1,
+            )
+            if entry_time is not None and (
+                hit_time is None or entry_time < hit_time
+            ):
+                hit, hit_time = obstacle, entry_time
+        return hit
+
+    def update(self, rows_number: int, columns_number: int) -> None:
+        """Move all shots, mark hit obstacles and remove spent shots.
+
+        Shots are removed as soon as they leave the area inside
+        the window border.
+
+        Args:
+            rows_number: Number of window rows;
+            columns_number: Number of window columns.
+        """
+
+        rows, columns = self.rows, self.columns
+        rows_speed, columns_speed = self.rows_speed, self.columns_speed
+        ages = self.ages
+        still_tics = len(FLASH_SPRITES)
+        max_row, max_column = rows_number - 1, columns_number - 1
+
+        for slot, is_active in enumerate(self.is_active):
+            if not is_active:
+                continue
+
+            ages[slot] += 1
+            if ages[slot] < still_tics:
+                continue  # fire flashes in place before flying
+
+            row, column = rows[slot], columns[slot]
+            rows_delta, columns_delta = rows_speed[slot], columns_speed[slot]
+            obstacle = self._find_hit(row, column, rows_delta, columns_delta)
+            if obstacle is not None:
+                obstacle.is_hit = True
+                self._release(slot)
+                continue
+
+            row += rows_delta
+            column += columns_delta
+            if not (0 < row < max_row and 0 < column < max_column):
+                self._release(slot)
+                continue
+            rows[slot], columns[slot] = row, column
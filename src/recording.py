@@ -0,0 +1,132 @@
+import json
+import typing
+
+from curses_tools import DOWN_KEY_CODE
+from curses_tools import LEFT_KEY_CODE
+from curses_tools import RIGHT_KEY_CODE
+from curses_tools import SPACE_KEY_CODE
+from curses_tools import UP_KEY_CODE
+
+ROWS_KEY_CODES = {-1: UP_KEY_CODE, 1: DOWN_KEY_CODE}
+COLUMNS_KEY_CODES = {-1: LEFT_KEY_CODE, 1: RIGHT_KEY_CODE}
+
+
+class Recording:
+    """Game session which can be replayed exactly.
+
+    Game randomness comes only from the `random` module seeded with
+    `seed`, so besides the seed and the window size the session is
+    defined by controls state read in each tic and by window resizes.
+    Each state is packed into one byte: rows direction, columns
+    direction and number of fire presses up to 7. Each resize is kept
+    with the number of tics played before it.
+
+    Args:
+        seed: Seed of the `random` module;
+        rows: Number of window rows at the start;
+        columns: Number of window columns at the start;
+        bots_count: Number of bot ships;
+        tics: Number of tics in the session;
+        controls: Packed controls states;
+        resizes: Tic numbers and new numbers of rows and columns.
+    """
+
+    def __init__(
+        self,
+        seed: int,
+        rows: int = 0,
+        columns: int = 0,
+        bots_count: int = 0,
+        tics: int = 0,
+        controls: bytes = b'',
+        resizes: typing.Iterable[typing.Sequence[int]] = (),
+    ) -> None:
+        self.seed = seed
+        self.rows = rows
+        self.columns = columns
+        self.bots_count = bots_count
+        self.tics = tics
+        self.controls = bytearray(controls)
+        self.resizes = [tuple(resize) for resize in resizes]
+
+    def record(
+        self,
+        rows_direction: int,
+        columns_direction: int,
+        fire_presses: int,
+    ) -> None:
+        """Add controls state read in a tic.
+
+        Args:
+            rows_direction: Vertical direction, -1, 0 or 1;
+            columns_direction: Horizontal direction, -1, 0 or 1;
+            fire_presses: Number of fire presses.
+        """
+
+        state = rows_direction + 1 | (columns_direction + 1) << 2
+        self.controls.append(state | min(fire_presses, 7) << 4)
+
+    def record_resize(self, rows: int, columns: int) -> None:
+        """Add window resize seen at the start of the current tic.
+
+        Args:
+            rows: Number of window rows;
+            columns: Number of window columns.
+        """
+
+        self.resizes.append((self.tics, rows, columns))
+
+    def get_window_sizes(self) -> dict[int, tuple[int, int]]:
+        """Get window sizes by the number of tics played before resize."""
+
+        return {tic: (rows, columns) for tic, rows, columns in self.resizes}
+
+    def get_keys(self) -> typing.Generator[int, None, None]:
+        """Get key codes reproducing recorded controls states.
+
+        Yields:
+            Codes of pressed keys, -1 ends keys of a tic.
+        """
+
+        for state in self.controls:
+            rows_direction = (state & 0b11) - 1
+            columns_direction = (state >> 2 & 0b11) - 1
+            if rows_direction:
+                yield ROWS_KEY_CODES[rows_direction]
+            if columns_direction:
+                yield COLUMNS_KEY_CODES[columns_direction]
+            for _ in range(state >> 4):
+                yield SPACE_KEY_CODE
+            yield -1
+
+    def save(self, path: str) -> None:
+        """Write recording — JSON header line, then controls bytes.
+
+        Args:
+            path: Path to recording file.
+        """
+
+        header = {
+            'seed': self.seed,
+            'rows': self.rows,
+            'columns': self.columns,
+            'bots_count': self.bots_count,
+            'tics': self.tics,
+            'resizes': self.resizes,
+        }
+        with open(path, 'wb') as recording_file:
+            recording_file.write(json.dumps(header).encode() + b'\n')
+            recording_file.write(self.controls)
+
+    @classmethod
+    def load(cls, path: str) -> 'Recording':
+        """Read recording written by `save`.
+
+        Args:
+            path: Path to recording file.
+        """
+
+        with open(path, 'rb') as recording_file:
+            header = json.loads(recording_file.readline())
+            controls = recording_file.read()
+        return cls(controls=controls, **header)
@@ -0,0 +1,173 @@
+import itertools
+import typing
+
+from coroutines_stats import CoroutinesStats
+
+
+class Task:
+    def __init__(
+        self,
+        task_id: int,
+        coroutine: typing.Coroutine,
+        group: str | None = None,
+    ) -> None:
+        self.task_id = task_id
+        self.coroutine = coroutine
+        self.group = group
+        self.is_cancelled = False
+
+
+class Scheduler:
+    """Tic based scheduler of game coroutines.
+
+    Coroutine yielding None (e.g. `asyncio.sleep(0)`) is resumed in the
+    next tic. Coroutine yielding number of tics (see `make_delay`) is
+    parked in a timer wheel — lists of tasks by wake tic — and is not
+    resumed until its wake tic comes. So each tic touches only tasks
+    which are due.
+
+    Tasks are registered by id and optionally by group, cancelled
+    tasks are skipped when their turn comes, so adding and cancelling
+    a task never scans the queues.
+
+    Args:
+        coroutines_stats: Stats to collect CPU time of coroutines.
+    """
+
+    def __init__(self, coroutines_stats: CoroutinesStats | None = None):
+        self.coroutines_stats = coroutines_stats
+        self.tic = 0
+
+        self._tasks: dict[int, Task] = {}
+        self._groups: dict[str, dict[int, Task]] = {}
+        self._task_ids = itertools.count()
+        self._current_task: Task | None = None
+
+        self._ready: list[Task] = []
+        self._timers: dict[int, list[Task]] = {}
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __contains__(self, task_id: int) -> bool:
+        return task_id in self._tasks
+
+    def get_group_size(self, group: str) -> int:
+        """Get number of live tasks in a group.
+
+        Args:
+            group: Group name.
+        """
+
+        return len(self._groups.get(group, ()))
+
+    def spawn(
+        self,
+        coroutine: typing.Coroutine,
+        group: str | None = None,
+    ) -> int:
+        """Add task, it starts in the next run tic.
+
+        Args:
+            coroutine: Game coroutine;
+            group: Name of tasks group, e.g. to cancel them together.
+
+        Returns:
+            Task id.
+        """
+
+        task = Task(next(self._task_ids), coroutine, group)
+        self._tasks[task.task_id] = task
+        if group is not None:
+            self._groups.setdefault(group, {})[task.task_id] = task
+
+        self._ready.append(task)
+        return task.task_id
+
+    def _unregister(self, task: Task) -> None:
+        del self._tasks[task.task_id]
+        if task.group is not None:
+            group = self._groups[task.group]
+            del group[task.task_id]
+            if not group:
+                del self._groups[task.group]
+
+    def cancel(self, task_id: int) -> None:
+        """Cancel task, its coroutine won't be resumed anymore.
+
+        Args:
+            task_id: Id of live task.
+        """
+
+        task = self._tasks[task_id]
+        self._unregister(task)
+        task.is_cancelled = True
+
+        if self.coroutines_stats:
+            self.coroutines_stats.discard(task.coroutine)
+        # running coroutine can't be closed, it's closed after its step
+        if task is not self._current_task:
+            task.coroutine.close()
+
+    def cancel_group(self, group: str) -> None:
+        """Cancel all tasks of a group.
+
+        Args:
+            group: Group name.
+        """
+
+        for task_id in list(self._groups.get(group, ())):
+            self.cancel(task_id)
+
+    def _step(self, task: Task) -> int | None:
+        """Resume task coroutine until it suspends.
+
+        Args:
+            task: Task to resume.
+
+        Returns:
+            Number of tics to sleep.
+
+        Raises:
+            StopIteration: If coroutine has finished.
+        """
+
+        self._current_task = task
+        try:
+            if self.coroutines_stats:
+                return self.coroutines_stats.send(task.coroutine)
+            return task.coroutine.send(None)
+        finally:
+            self._current_task = None
+
+    def run_tic(self) -> None:
+        """Resume tasks due in the current tic."""
+
+        due = self._ready
+        self._ready = []
+
+        woken = self._timers.pop(self.tic, None)
+        if woken:
+            due.extend(woken)
+
+        for task in due:
+            if task.is_cancelled:
+                continue
+
+            try:
+                tics = self._step(task)
+            except StopIteration:
+                # task may have cancelled itself before finishing
+                if not task.is_cancelled:
+                    self._unregister(task)
+                continue
+
+            if task.is_cancelled:
+                task.coroutine.close()
+            elif tics is None or tics == 1:
+                self._ready.append(task)
+            else:
+                wake_tic = self.tic + tics
+                self._timers.setdefault(wake_tic, []).append(task)
+
+        self.tic += 1
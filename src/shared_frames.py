@@ -0,0 +1,282 @@
+import curses
+import selectors
+import struct
+import sys
+import typing
+from array import array
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+
+from headless import HeadlessCanvas
+
+# number of the latest published frame, written by simulation
+FRAME_NUMBER = struct.Struct('q')
+# window size requested by renderer
+SIZE = struct.Struct('qq')
+HEADER_SIZE = FRAME_NUMBER.size + SIZE.size
+# frame number, 0 while the slot is written, and frame size
+SLOT_HEADER = struct.Struct('qqq')
+# symbols are stored as code points
+SYMBOL_SIZE = array('I').itemsize
+ATTR_SIZE = array('L').itemsize
+
+Frame = tuple[int, int, array, array]
+
+
+class FrameRing:
+    """Ring of frame slots in shared memory.
+
+    Simulation process publishes each frame into the next slot, while
+    renderer process copies the newest complete one. A slot number is
+    reset while the slot is written and set back after that, so
+    the renderer notices frames overwritten while it copied them and
+    takes the newer frame instead. Neither side ever waits for
+    the other one.
+
+    Args:
+        max_rows: Max number of frame rows;
+        max_columns: Max number of frame columns;
+        slots_count: Number of frame slots.
+    """
+
+    def __init__(
+        self,
+        max_rows: int,
+        max_columns: int,
+        slots_count: int = 3,
+    ) -> None:
+        self.max_rows = max_rows
+        self.max_columns = max_columns
+        self.slots_count = slots_count
+
+        cells_count = max_rows * max_columns
+        self._symbols_offset = SLOT_HEADER.size
+        self._attrs_offset = self._symbols_offset + cells_count * SYMBOL_SIZE
+        self._slot_size = self._attrs_offset + cells_count * ATTR_SIZE
+
+        memory_size = HEADER_SIZE + self._slot_size * slots_count
+        self.memory = SharedMemory(create=True, size=memory_size)
+        FRAME_NUMBER.pack_into(self.memory.buf, 0, 0)
+        self.set_size(max_rows, max_columns)
+
+    def _get_slot_offset(self, frame_number: int) -> int:
+        slot = frame_number % self.slots_count
+        return HEADER_SIZE + slot * self._slot_size
+
+    def get_size(self) -> tuple[int, int]:
+        """Get window size requested by the renderer."""
+
+        return SIZE.unpack_from(self.memory.buf, FRAME_NUMBER.size)
+
+    def set_size(self, rows: int, columns: int) -> None:
+        """Request window size, it's cropped to the max frame size.
+
+        Args:
+            rows: Number of window rows;
+            columns: Number of window columns.
+        """
+
+        rows = min(rows, self.max_rows)
+        columns = min(columns, self.max_columns)
+        SIZE.pack_into(self.memory.buf, FRAME_NUMBER.size, rows, columns)
+
+    def publish(self, canvas: HeadlessCanvas) -> None:
+        """Copy window content into the next slot.
+
+        Args:
+            canvas: In-memory window no bigger than the max frame size.
+        """
+
+        buffer = self.memory.buf
+        (frame_number,) = FRAME_NUMBER.unpack_from(buffer, 0)
+        frame_number += 1
+        offset = self._get_slot_offset(frame_number)
+
+        SLOT_HEADER.pack_into(buffer, offset, 0, 0, 0)
+        symbols = memoryview(canvas.symbols).cast('B')
+        start = offset + self._symbols_offset
+        buffer[start : start + len(symbols)] = symbols
+        attrs = memoryview(canvas.attrs).cast('B')
+        start = offset + self._attrs_offset
+        buffer[start : start + len(attrs)] = attrs
+        SLOT_HEADER.pack_into(
+            buffer, offset, frame_number, canvas.rows, canvas.columns
+        )
+
+        FRAME_NUMBER.pack_into(buffer, 0, frame_number)
+
+    def read(self, last_frame_number: int = 0) -> Frame | None:
+        """Copy the newest complete frame.
+
+        Args:
+            last_frame_number: Number of the frame read before.
+
+        Returns:
+            Frame number, number of its columns, code points of symbols
+            and attributes of its cells, or None if there is no newer
+            frame.
+        """
+
+        buffer = self.memory.buf
+        while True:
+            (frame_number,) = FRAME_NUMBER.unpack_from(buffer, 0)
+            if frame_number == last_frame_number:
+                return None
+
+            offset = self._get_slot_offset(frame_number)
+            slot_frame_number, rows, columns = SLOT_HEADER.unpack_from(
+                buffer, offset
+            )
+            if slot_frame_number != frame_number:
+                continue  # slot is being overwritten with a newer frame
+
+            cells_count = rows * columns
+            symbols = array('I')
+            start = offset + self._symbols_offset
+            symbols.frombytes(
+                buffer[start : start + cells_count * SYMBOL_SIZE]
+            )
+            attrs = array('L')
+            start = offset + self._attrs_offset
+            attrs.frombytes(buffer[start : start + cells_count * ATTR_SIZE])
+
+            slot_frame_number, _, _ = SLOT_HEADER.unpack_from(buffer, offset)
+            if slot_frame_number == frame_number:
+                return frame_number, columns, symbols, attrs
+
+    def close(self) -> None:
+        self.memory.close()
+
+    def unlink(self) -> None:
+        self.memory.unlink()
+
+
+class SharedFrameCanvas(HeadlessCanvas):
+    """In-memory window of simulation process.
+
+    Each refresh publishes window content to the frame ring. Window
+    size follows the size requested by the renderer, keys pressed
+    in the renderer come through a pipe.
+
+    Args:
+        frame_ring: Ring to publish frames to;
+        keys_connection: Pipe end to receive codes of pressed keys.
+    """
+
+    def __init__(
+        self,
+        frame_ring: FrameRing,
+        keys_connection: Connection,
+    ) -> None:
+        super().__init__(*frame_ring.get_size())
+        self.frame_ring = frame_ring
+        self.keys_connection = keys_connection
+
+    def getmaxyx(self) -> tuple[int, int]:
+        size = self.frame_ring.get_size()
+        if size != (self.rows, self.columns):
+            self.resize(*size)
+        return size
+
+    def getch(self) -> int:
+        while self.keys_connection.poll():
+            self.keys.append(self.keys_connection.recv())
+        return super().getch()
+
+    def refresh(self) -> None:
+        super().refresh()
+        self.frame_ring.publish(self)
+
+
+def draw_changes(
+    canvas: curses.window,
+    columns: int,
+    symbols: array,
+    attrs: array,
+    last_symbols: array,
+    last_attrs: array,
+) -> None:
+    """Draw cells which differ from the previous frame.
+
+    Args:
+        canvas: Main window;
+        columns: Number of frame columns;
+        symbols: Code points of frame cells symbols;
+        attrs: Attributes of frame cells;
+        last_symbols: Code points of the previous frame cells symbols;
+        last_attrs: Attributes of the previous frame cells.
+    """
+
+    for start in range(0, len(symbols), columns):
+        end = start + columns
+        is_same_symbols = symbols[start:end] == last_symbols[start:end]
+        if is_same_symbols and attrs[start:end] == last_attrs[start:end]:
+            continue
+
+        row = start // columns
+        for index in range(start, end):
+            symbol, attr = symbols[index], attrs[index]
+            if symbol == last_symbols[index] and attr == last_attrs[index]:
+                continue
+            try:
+                canvas.addstr(row, index - start, chr(symbol), attr)
+            except curses.error:
+                pass  # the last cell or window is smaller than the frame
+
+
+def render_frames(
+    canvas: curses.window,
+    frame_ring: FrameRing,
+    keys_connection: Connection,
+    is_simulation_alive: typing.Callable[[], bool],
+    poll_timeout: float,
+) -> None:
+    """Draw frames published by simulation process while it runs.
+
+    Pressed keys are sent to the simulation, terminal resize is
+    requested from it.
+
+    Args:
+        canvas: Main window;
+        frame_ring: Ring to read frames from;
+        keys_connection: Pipe end to send codes of pressed keys;
+        is_simulation_alive: Function telling if simulation still runs;
+        poll_timeout: Time in seconds to wait for keys between checks
+            for a new frame.
+    """
+
+    canvas.nodelay(True)
+
+    selector = selectors.DefaultSelector()
+    selector.register(sys.stdin.fileno(), selectors.EVENT_READ)
+
+    frame_number = 0
+    last_columns = 0
+    last_symbols, last_attrs = array('I'), array('L')
+    while is_simulation_alive():
+        while True:
+            pressed_key_code = canvas.getch()
+            if pressed_key_code == -1:
+                break
+            if pressed_key_code == curses.KEY_RESIZE:
+                frame_ring.set_size(*canvas.getmaxyx())
+            else:
+                keys_connection.send(pressed_key_code)
+
+        frame = frame_ring.read(frame_number)
+        if frame is not None:
+            frame_number, columns, symbols, attrs = frame
+            if (columns, len(symbols)) != (last_columns, len(last_symbols)):
+                canvas.clear()
+                last_columns = columns
+                last_symbols = array('I', [ord(' ')]) * len(symbols)
+                last_attrs = array('L', [curses.A_NORMAL]) * len(symbols)
+
+            draw_changes(
+                canvas, columns, symbols, attrs, last_symbols, last_attrs
+            )
+            canvas.refresh()
+            last_symbols, last_attrs = symbols, attrs
+
+        selector.select(poll_timeout)
+    selector.close()
@@ -0,0 +1,175 @@
+import random
+from array import array
+
+from obstacles import Boxes
+from obstacles import ObstaclesGrid
+from physics import update_speeds
+
+# chance of a bot to choose new target in a tic
+RETARGET_CHANCE = 0.05
+# number of tics between two shots of a bot
+FIRE_COOLDOWN_TICS = 8
+
+
+class Ships:
+    """Struct of arrays store of bot ships of the same size.
+
+    Ships are moved all at once: speeds of all ships are updated
+    by one `update_speeds` call, then positions are shifted and
+    clamped inside the window border.
+
+    Args:
+        rows_size: Ship frame height;
+        columns_size: Ship frame width.
+    """
+
+    def __init__(self, rows_size: int, columns_size: int) -> None:
+        self.rows_size = rows_size
+        self.columns_size = columns_size
+
+        self.rows = array('d')
+        self.columns = array('d')
+        self.rows_speed = array('d')
+        self.columns_speed = array('d')
+        self.rows_directions = array('b')
+        self.columns_directions = array('b')
+        self.target_columns = array('d')
+        self.fire_cooldowns = array('H')
+
+        self._columns = (
+            self.rows,
+            self.columns,
+            self.rows_speed,
+            self.columns_speed,
+            self.rows_directions,
+            self.columns_directions,
+            self.target_columns,
+            self.fire_cooldowns,
+        )
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def add(self, row: float, column: float) -> None:
+        """Add standing ship.
+
+        Args:
+            row: Left upper row position;
+            column: Left upper column position.
+        """
+
+        for values_column, value in zip(
+            self._columns, (row, column, 0, 0, 0, 0, column, 0)
+        ):
+            values_column.append(value)
+
+    def remove(self, indices: set[int]) -> None:
+        """Remove ships keeping order of the rest.
+
+        Args:
+            indices: Indices of ships to remove.
+        """
+
+        alive_count = 0
+        for index in range(len(self.rows)):
+            if index in indices:
+                continue
+            if alive_count != index:
+                for values_column in self._columns:
+                    values_column[alive_count] = values_column[index]
+            alive_count += 1
+
+        for values_column in self._columns:
+            del values_column[alive_count:]
+
+    def move(self, rows_number: int, columns_number: int) -> None:
+        """Update speeds by current directions and move all ships.
+
+        Args:
+            rows_number: Number of window rows;
+            columns_number: Number of window columns.
+        """
+
+        update_speeds(
+            self.rows_speed,
+            self.columns_speed,
+            self.rows_directions,
+            self.columns_directions,
+        )
+
+        # the coordinates of the last cell are 1 smaller
+        max_row = rows_number - 1 - self.rows_size
+        max_column = columns_number - 1 - self.columns_size
+        for positions, speeds, max_position in (
+            (self.rows, self.rows_speed, max_row),
+            (self.columns, self.columns_speed, max_column),
+        ):
+            for index, speed in enumerate(speeds):
+                position = positions[index] + speed
+                if position < 1:
+                    position = 1
+                elif position > max_position:
+                    position = max_position
+                positions[index] = position
+
+    def get_boxes(self) -> Boxes:
+        """Get bounding boxes of all ships."""
+
+        count = len(self.rows)
+        return Boxes(
+            self.rows,
+            self.columns,
+            [self.rows_size] * count,
+            [self.columns_size] * count,
+        )
+
+
+def steer_bots(
+    ships: Ships,
+    obstacles: ObstaclesGrid,
+    columns_number: int,
+    rng: random.Random,
+) -> list[int]:
+    """Choose directions of bot ships and find bots firing in this tic.
+
+    Bot hunts garbage: it flies under a chosen garbage, fires when
+    it's aligned with it and drifts up and down randomly. Sometimes
+    bot chooses new garbage to hunt.
+
+    Args:
+        ships: Bot ships;
+        obstacles: Grid of garbage;
+        columns_number: Number of window columns;
+        rng: Random numbers generator.
+
+    Returns:
+        Indices of firing ships.
+    """
+
+    targets = [
+        obstacle.column + obstacle.columns_size / 2
+        for obstacle in obstacles
+        if not obstacle.is_hit
+    ]
+    half_width = ships.columns_size / 2
+
+    firing = []
+    columns, target_columns = ships.columns, ships.target_columns
+    fire_cooldowns = ships.fire_cooldowns
+    for index in range(len(ships)):
+        if rng.random() < RETARGET_CHANCE:
+            if targets:
+                target_columns[index] = rng.choice(targets)
+            else:
+                target_columns[index] = rng.uniform(1, columns_number - 1)
+
+        distance = target_columns[index] - (columns[index] + half_width)
+        ships.columns_directions[index] = (distance > 1) - (distance < -1)
+        ships.rows_directions[index] = rng.choice((-1, 0, 0, 1))
+
+        if fire_cooldowns[index]:
+            fire_cooldowns[index] -= 1
+        elif abs(distance) <= 1:
+            fire_cooldowns[index] = FIRE_COOLDOWN_TICS
+            firing.append(index)
+    return firing
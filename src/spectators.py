@@ -0,0 +1,398 @@
+import argparse
+import collections
+import curses
+import os
+import select
+import socket
+import struct
+import sys
+import typing
+import zlib
+
+from tic_barrier import TicBarrier
+
+# message types: window size, full frame and frame changes
+SIZE_MESSAGE = b'S'
+FRAME_MESSAGE = b'F'
+CHANGES_MESSAGE = b'D'
+
+MESSAGE_LENGTH = struct.Struct('!I')
+SIZE = struct.Struct('!HH')
+# spectator is resynced instead of buffering more, e.g. if it's slow
+MAX_PENDING_BYTES = 256 * 1024
+# seconds viewer waits for data before checking keys again
+WATCH_TIMEOUT = 0.1
+
+Change = tuple[int, int, str, int]
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def encode_cells(changes: typing.Iterable[Change], columns: int) -> bytes:
+    """Pack changed cells into compressed runs.
+
+    Neighbour cells of a row with the same attributes are joined
+    into runs, each run is stored as distance from the end of the
+    previous run, attributes and text.
+
+    Args:
+        changes: Changed cells sorted by position: row, column,
+            symbol and attributes;
+        columns: Number of window columns.
+
+    Returns:
+        Compressed runs.
+    """
+
+    runs: list[list] = []
+    for row, column, symbol, attr in changes:
+        index = row * columns + column
+        if runs and column:
+            start, text, run_attr = runs[-1]
+            if start + len(text) == index and run_attr == attr:
+                runs[-1][1] += symbol
+                continue
+        runs.append([index, symbol, attr])
+
+    buffer = bytearray()
+    previous_end = 0
+    for start, text, attr in runs:
+        encoded_text = text.encode()
+        _write_varint(buffer, start - previous_end)
+        _write_varint(buffer, attr)
+        _write_varint(buffer, len(encoded_text))
+        buffer += encoded_text
+        previous_end = start + len(text)
+    return zlib.compress(buffer, 1)
+
+
+def decode_cells(data: bytes, columns: int) -> list[Change]:
+    """Unpack runs packed by `encode_cells`.
+
+    Args:
+        data: Compressed runs;
+        columns: Number of window columns.
+
+    Returns:
+        Runs of cells: row, column, text and attributes.
+    """
+
+    data = zlib.decompress(data)
+    runs = []
+    offset = previous_end = 0
+    while offset < len(data):
+        distance, offset = _read_varint(data, offset)
+        attr, offset = _read_varint(data, offset)
+        length, offset = _read_varint(data, offset)
+        text = data[offset : offset + length].decode()
+        offset += length
+
+        start = previous_end + distance
+        row, column = divmod(start, columns)
+        runs.append((row, column, text, attr))
+        previous_end = start + len(text)
+    return runs
+
+
+def pack_message(message_type: bytes, payload: bytes) -> bytes:
+    return MESSAGE_LENGTH.pack(len(payload) + 1) + message_type + payload
+
+
+def parse_address(address: str) -> tuple[int, str | tuple[str, int]]:
+    """Get socket family and address from `host:port` or Unix socket path.
+
+    Args:
+        address: TCP address or path to Unix socket.
+    """
+
+    host, separator, port = address.rpartition(':')
+    if separator and port.isdigit():
+        return socket.AF_INET, (host or '127.0.0.1', int(port))
+    return socket.AF_UNIX, address
+
+
+class Spectator:
+    def __init__(self, connection: socket.socket) -> None:
+        self.connection = connection
+        self.messages: collections.deque[bytes] = collections.deque()
+        self.pending_bytes = 0
+        self.sent_bytes = 0  # bytes of the first message already sent
+
+
+class SpectatorServer:
+    """Broadcast of game frames to spectators over a socket.
+
+    Everything is non-blocking: the game queues changes of each tic,
+    then the server accepts spectators and sends them as much as their
+    sockets take, in the game loop or in an asyncio task. A new
+    spectator gets window size and the full frame, then changed cells
+    of each tic. When a spectator doesn't read
+    fast enough and its queue grows over MAX_PENDING_BYTES, queued
+    changes are dropped and the spectator gets the full frame again,
+    so a slow spectator never stalls the game.
+
+    Args:
+        address: `host:port` or path to Unix socket to listen on.
+    """
+
+    def __init__(self, address: str) -> None:
+        family, self.address = parse_address(address)
+        self.socket = socket.socket(family, socket.SOCK_STREAM)
+        if family == socket.AF_INET:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind(self.address)
+        self.socket.listen()
+        self.socket.setblocking(False)
+
+        self.spectators: list[Spectator] = []
+        self.spectators_count = 0  # all spectators ever connected
+        # resyncs of all spectators, including disconnected ones
+        self.resyncs = 0
+        self.rows = self.columns = 0
+        # copy of the frame spectators see, to send it to new ones
+        self._frame: dict[tuple[int, int], tuple[str, int]] = {}
+        self._frame_message: bytes | None = None
+
+    def _get_frame_message(self) -> bytes:
+        if self._frame_message is None:
+            size = SIZE.pack(self.rows, self.columns)
+            frame = sorted(
+                (*position, *cell) for position, cell in self._frame.items()
+            )
+            self._frame_message = pack_message(
+                SIZE_MESSAGE, size
+            ) + pack_message(FRAME_MESSAGE, encode_cells(frame, self.columns))
+        return self._frame_message
+
+    def _enqueue(self, spectator: Spectator, message: bytes) -> None:
+        if spectator.pending_bytes + len(message) > MAX_PENDING_BYTES:
+            # keep only the partly sent message to not break the stream
+            if spectator.sent_bytes:
+                first_message = spectator.messages[0]
+                spectator.messages.clear()
+                spectator.messages.append(first_message)
+                spectator.pending_bytes = len(first_message)
+            else:
+                spectator.messages.clear()
+                spectator.pending_bytes = 0
+            self.resyncs += 1
+            message = self._get_frame_message()
+
+        spectator.messages.append(message)
+        spectator.pending_bytes += len(message)
+
+    def _flush(self, spectator: Spectator) -> bool:
+        """Send queued messages while the socket takes them.
+
+        Args:
+            spectator: Spectator to send messages to.
+
+        Returns:
+            False if spectator has disconnected.
+        """
+
+        messages = spectator.messages
+        while messages:
+            data = memoryview(messages[0])[spectator.sent_bytes :]
+            try:
+                sent = spectator.connection.send(data)
+            except BlockingIOError:
+                return True
+            except OSError:
+                return False
+
+            spectator.sent_bytes += sent
+            if spectator.sent_bytes < len(messages[0]):
+                return True
+            spectator.pending_bytes -= len(messages.popleft())
+            spectator.sent_bytes = 0
+        return True
+
+    def publish(self, changes: list[Change], rows: int, columns: int) -> None:
+        """Queue changed cells of the tic to spectators.
+
+        Args:
+            changes: Cells changed in the tic sorted by position: row,
+                column, symbol and attributes;
+            rows: Number of window rows;
+            columns: Number of window columns.
+        """
+
+        is_resized = (rows, columns) != (self.rows, self.columns)
+        if is_resized:
+            # window is redrawn from scratch after resize
+            self.rows, self.columns = rows, columns
+            self._frame = {}
+
+        frame = self._frame
+        for row, column, symbol, attr in changes:
+            if symbol == ' ' and attr == curses.A_NORMAL:
+                frame.pop((row, column), None)
+            else:
+                frame[row, column] = (symbol, attr)
+        self._frame_message = None
+
+        if is_resized:
+            message = self._get_frame_message()
+        elif changes:
+            message = pack_message(
+                CHANGES_MESSAGE, encode_cells(changes, columns)
+            )
+        else:
+            return
+
+        for spectator in self.spectators:
+            self._enqueue(spectator, message)
+
+    def send(self) -> None:
+        """Send queued messages as far as sockets take them.
+
+        Also accepts new spectators and drops disconnected ones.
+        """
+
+        connected = []
+        for spectator in self.spectators:
+            if self._flush(spectator):
+                connected.append(spectator)
+            else:
+                spectator.connection.close()
+
+        while True:
+            try:
+                connection, _ = self.socket.accept()
+            except BlockingIOError:
+                break
+            connection.setblocking(False)
+            spectator = Spectator(connection)
+            self.spectators_count += 1
+            self._enqueue(spectator, self._get_frame_message())
+            if self._flush(spectator):
+                connected.append(spectator)
+            else:
+                connection.close()
+        self.spectators = connected
+
+    def close(self) -> None:
+        for spectator in self.spectators:
+            spectator.connection.close()
+        self.socket.close()
+        if isinstance(self.address, str):
+            os.unlink(self.address)
+
+
+async def serve_spectators(
+    spectator_server: SpectatorServer,
+    tic_barrier: TicBarrier,
+) -> None:
+    """Send frames to spectators after each tic on asyncio event loop.
+
+    Args:
+        spectator_server: Server with changes queued by the game;
+        tic_barrier: Barrier released by the game after each tic.
+    """
+
+    while True:
+        await tic_barrier.wait()
+        spectator_server.send()
+
+
+def take_messages(data: bytearray) -> list[tuple[bytes, bytes]]:
+    """Take complete messages from the start of received data.
+
+    Args:
+        data: Data received from the server, complete messages are
+            removed from it.
+
+    Returns:
+        Message types and payloads.
+    """
+
+    messages = []
+    offset = 0
+    while len(data) - offset >= MESSAGE_LENGTH.size:
+        (length,) = MESSAGE_LENGTH.unpack_from(data, offset)
+        end = offset + MESSAGE_LENGTH.size + length
+        if len(data) < end:
+            break
+        start = offset + MESSAGE_LENGTH.size
+        messages.append(
+            (bytes(data[start : start + 1]), data[start + 1 : end])
+        )
+        offset = end
+    del data[:offset]
+    return messages
+
+
+def watch(canvas: curses.window, address: str) -> None:
+    """Render game streamed by the server, `q` quits.
+
+    Args:
+        canvas: Main window;
+        address: `host:port` or path to Unix socket of the server.
+    """
+
+    curses.curs_set(False)
+    canvas.nodelay(True)
+
+    family, socket_address = parse_address(address)
+    with socket.socket(family, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_address)
+
+        data = bytearray()
+        columns = 1
+        while canvas.getch() != ord('q'):
+            # wake up on a key too, so viewer quits even if stream stalls
+            readable, _, _ = select.select(
+                [connection, sys.stdin], [], [], WATCH_TIMEOUT
+            )
+            if connection not in readable:
+                continue
+
+            chunk = connection.recv(65536)
+            if not chunk:
+                return
+            data += chunk
+
+            for message_type, payload in take_messages(data):
+                if message_type == SIZE_MESSAGE:
+                    _, columns = SIZE.unpack(payload)
+                    continue
+
+                if message_type == FRAME_MESSAGE:
+                    canvas.erase()
+                for row, column, text, attr in decode_cells(payload, columns):
+                    try:
+                        canvas.addstr(row, column, text, attr)
+                    except curses.error:
+                        pass  # viewer window is smaller than the game one
+            canvas.refresh()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Watch space game.')
+    parser.add_argument(
+        'address',
+        help='`host:port` or path to Unix socket of the game',
+    )
+    args = parser.parse_args()
+
+    try:
+        curses.wrapper(watch, args.address)
+    except KeyboardInterrupt:
+        pass
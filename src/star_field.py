@@ -0,0 +1,142 @@
+import curses
+import typing
+from array import array
+
+from frame_buffer import FrameBuffer
+from game_utils import make_delay
+from load_governor import LoadGovernor
+
+BRIGHTNESS_PER_DELAY = [
+    (curses.A_DIM, 20),
+    (curses.A_NORMAL, 3),
+    (curses.A_BOLD, 5),
+    (curses.A_NORMAL, 3),
+]
+
+
+class StarField:
+    """Twinkling stars animated as a whole.
+
+    Stars share the brightness schedule and differ only by phase,
+    so for every tic of the schedule period the field keeps the list
+    of stars changing brightness in this tic. Animation touches only
+    these stars instead of resuming a coroutine for each star.
+
+    Args:
+        rows: Row position of each star;
+        columns: Column position of each star;
+        symbols: Symbol of each star;
+        delays: Delay before each star appears.
+    """
+
+    def __init__(
+        self,
+        rows: typing.Sequence[int],
+        columns: typing.Sequence[int],
+        symbols: str,
+        delays: typing.Sequence[int],
+    ) -> None:
+        self.rows = array('H', rows)
+        self.columns = array('H', columns)
+        self.symbols = symbols
+        self.delays = array('H', delays)
+
+        self.period = sum(delay for _, delay in BRIGHTNESS_PER_DELAY)
+        self._schedule: list[list[tuple[int, int]]] = [
+            [] for _ in range(self.period)
+        ]
+        for index, delay in enumerate(self.delays):
+            phase = delay
+            for brightness, brightness_delay in BRIGHTNESS_PER_DELAY:
+                self._schedule[phase % self.period].append((index, brightness))
+                phase += brightness_delay
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def rescale(
+        self,
+        old_size: tuple[int, int],
+        new_size: tuple[int, int],
+    ) -> None:
+        """Move stars keeping their relative positions inside the border.
+
+        Args:
+            old_size: Number of rows and columns of the old window;
+            new_size: Number of rows and columns of the new window.
+        """
+
+        for positions, old_number, new_number in (
+            (self.rows, old_size[0], new_size[0]),
+            (self.columns, old_size[1], new_size[1]),
+        ):
+            # positions run from 1 to number - 2 inside the border
+            ratio = max(new_number - 3, 0) / max(old_number - 3, 1)
+            for index, position in enumerate(positions):
+                positions[index] = 1 + round((position - 1) * ratio)
+
+    def get_changes(
+        self,
+        tic: int,
+        tics: int = 1,
+    ) -> typing.Generator[tuple[int, int, str, int], None, None]:
+        """Get stars changing brightness in a range of tics.
+
+        Only the last change of a star in the range is taken.
+
+        Args:
+            tic: Number of the first tic since the animation start;
+            tics: Number of tics in the range.
+
+        Yields:
+            Row, column, symbol and new brightness of a star.
+        """
+
+        changes = {}
+        for current_tic in range(tic, tic + tics):
+            is_first_period = current_tic < self.period
+            for index, brightness in self._schedule[current_tic % self.period]:
+                if is_first_period and current_tic < self.delays[index]:
+                    continue  # the star hasn't appeared yet
+                changes[index] = brightness
+
+        rows, columns, symbols = self.rows, self.columns, self.symbols
+        for index, brightness in changes.items():
+            yield rows[index], columns[index], symbols[index], brightness
+
+
+async def animate_star_field(
+    canvas: FrameBuffer,
+    star_field: StarField,
+    governor: LoadGovernor | None = None,
+) -> None:
+    """Animate twinkling stars.
+
+    Under load stars are updated less often, each update catches up
+    with the changes of the skipped tics. Stars follow window resize.
+
+    Args:
+        canvas: Frame buffer of main window;
+        star_field: Stars to animate;
+        governor: Governor choosing stars update period.
+    """
+
+    viewport = canvas.viewport
+    size = viewport.getmaxyx()
+    tic = 0
+    changes_tics = 1
+    while True:
+        if viewport.getmaxyx() != size:
+            # background is dropped on resize, so paint all stars again
+            star_field.rescale(size, viewport.getmaxyx())
+            size = viewport.getmaxyx()
+            changes_tics = star_field.period
+
+        for row, column, symbol, brightness in star_field.get_changes(
+            tic - changes_tics + 1, changes_tics
+        ):
+            canvas.paint(row, column, symbol, brightness)
+
+        changes_tics = governor.stars_period if governor else 1
+        tic += changes_tics
+        await make_delay(changes_tics)
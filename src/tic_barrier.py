@@ -0,0 +1,36 @@
+import asyncio
+
+
+class TicBarrier:
+    """Point where asyncio tasks wait for the end of game tic.
+
+    Game loop running on the event loop releases the barrier after
+    each tic is presented, so tasks like telemetry or network streams
+    run between tics and see the finished frame.
+    """
+
+    def __init__(self) -> None:
+        self._waiters: list[asyncio.Future] = []
+
+    async def wait(self) -> int:
+        """Wait for the current tic to finish.
+
+        Returns:
+            Number of finished tics.
+        """
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        return await waiter
+
+    def release(self, tics: int) -> None:
+        """Wake all tasks waiting for the tic.
+
+        Args:
+            tics: Number of finished tics.
+        """
+
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(tics)
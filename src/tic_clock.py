@@ -0,0 +1,117 @@
+import asyncio
+import time
+import typing
+
+
+class TicClock:
+    """Deadline based clock keeping a fixed tic period.
+
+    Tic boundaries are counted on the monotonic clock, so the clock
+    sleeps only for the time left after tic work and the game speed
+    doesn't depend on load. When a tic overruns its deadline, the clock
+    either runs the next tics without sleep until it catches up, or
+    skips the missed tics and starts counting from the current moment.
+    An overrun is counted as one missed deadline, however many tics
+    it takes to catch up. Unthrottled clock never sleeps and only
+    measures tics work.
+
+    Args:
+        tic_timeout: Tic period in seconds;
+        max_catch_up_tics: Max number of late tics to run without sleep,
+            missed tics are skipped if it is 0 or the lag is greater;
+        throttle: Flag indicating to keep tic period;
+        sleep: Function to sleep until the tic boundary, `time.sleep`
+            by default.
+    """
+
+    def __init__(
+        self,
+        tic_timeout: float,
+        max_catch_up_tics: int = 0,
+        throttle: bool = True,
+        sleep: typing.Callable[[float], None] | None = None,
+    ) -> None:
+        self.tic_timeout = tic_timeout
+        self.max_catch_up_tics = max_catch_up_tics
+        self.throttle = throttle
+        self.sleep = sleep or time.sleep
+
+        self.tics = 0
+        self.missed_deadlines = 0
+        self.skipped_tics = 0
+        self.last_work_time = 0.0
+        self.max_work_time = 0.0
+        self.total_work_time = 0.0
+
+        self._tic_start = time.monotonic()
+        self._deadline = self._tic_start + tic_timeout
+        self._is_late = False
+
+    @property
+    def average_work_time(self) -> float:
+        """Average time spent on tic work."""
+
+        return self.total_work_time / self.tics if self.tics else 0.0
+
+    @property
+    def is_over_budget(self) -> bool:
+        """Whether the last tic work took longer than tic period."""
+
+        return self.last_work_time > self.tic_timeout
+
+    def _finish_tic(self) -> float:
+        """Count tic work and move the deadline.
+
+        Returns:
+            Time to sleep until the next tic boundary in seconds.
+        """
+
+        now = time.monotonic()
+        work_time = now - self._tic_start
+
+        self.tics += 1
+        self.last_work_time = work_time
+        self.max_work_time = max(self.max_work_time, work_time)
+        self.total_work_time += work_time
+        self._tic_start = now
+
+        if not self.throttle:
+            return 0.0
+
+        if now < self._deadline:
+            sleep_time = self._deadline - now
+            self._deadline += self.tic_timeout
+            self._is_late = False
+            return sleep_time
+
+        # catch-up tics are late because of the same overrun
+        if not self._is_late:
+            self.missed_deadlines += 1
+        lag_tics = int((now - self._deadline) / self.tic_timeout)
+        if lag_tics < self.max_catch_up_tics:
+            self._deadline += self.tic_timeout
+            self._is_late = True
+        else:
+            self.skipped_tics += lag_tics
+            self._deadline = now + self.tic_timeout
+            self._is_late = False
+        return 0.0
+
+    def wait(self) -> None:
+        """Finish the tic and wait for the next tic boundary."""
+
+        sleep_time = self._finish_tic()
+        if sleep_time:
+            self.sleep(sleep_time)
+            self._tic_start = time.monotonic()
+
+    async def wait_async(self) -> None:
+        """Finish the tic and wait for the next tic boundary.
+
+        Event loop runs other tasks while waiting, it yields to them
+        even if there is no time left.
+        """
+
+        sleep_time = self._finish_tic()
+        await asyncio.sleep(sleep_time)
+        self._tic_start = time.monotonic()
@@ -0,0 +1,51 @@
+import curses
+
+from headless import HeadlessCanvas
+
+
+class Viewport:
+    """Window size shared by the game.
+
+    Size is read from the window once per tic or when the terminal
+    reports resize, everything else reads bounds from the viewport.
+    `resizes` counter lets code which laid out something for the old
+    size notice the change.
+
+    Args:
+        window: Main window or its in-memory replacement.
+    """
+
+    def __init__(self, window: curses.window | HeadlessCanvas) -> None:
+        self.window = window
+        self.rows, self.columns = window.getmaxyx()
+        self.resizes = 0
+
+    @property
+    def max_row(self) -> int:
+        """Row coordinate of the last cell."""
+
+        return self.rows - 1
+
+    @property
+    def max_column(self) -> int:
+        """Column coordinate of the last cell."""
+
+        return self.columns - 1
+
+    def getmaxyx(self) -> tuple[int, int]:
+        return self.rows, self.columns
+
+    def update(self) -> bool:
+        """Read window size.
+
+        Returns:
+            True if window has been resized.
+        """
+
+        rows, columns = self.window.getmaxyx()
+        if (rows, columns) == (self.rows, self.columns):
+            return False
+
+        self.rows, self.columns = rows, columns
+        self.resizes += 1
+        return True